@@ -0,0 +1,57 @@
+"""Add composite access path indexes
+
+Revision ID: 3c7d1e9a4b52
+Revises: f2a9dadc716a
+Create Date: 2026-10-18 09:12:41.508113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7d1e9a4b52'
+down_revision: Union[str, Sequence[str], None] = 'f2a9dadc716a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Goals: own goals by status, reviewer queues by status
+    op.create_index('ix_goals_user_id_status', 'goals', ['user_id', 'status'], unique=False)
+    op.create_index('ix_goals_reviewer_id_status', 'goals', ['reviewer_id', 'status'], unique=False)
+
+    # Users: direct reports of a manager, optionally by role
+    op.create_index('ix_users_manager_id_role', 'users', ['manager_id', 'role'], unique=False)
+
+    # Notifications: a user's feed, unread filter, newest first
+    op.create_index('ix_notifications_user_id_is_read_created_at', 'notifications',
+                    ['user_id', 'is_read', 'created_at'], unique=False)
+
+    # Skills: a user's skills, optionally by category
+    op.create_index('ix_skills_user_id_category', 'skills', ['user_id', 'category'], unique=False)
+
+    # Reviews: duplicate check / comparison per goal, manager review rollups
+    op.create_index('ix_reviews_goal_id_quarter_review_type', 'reviews',
+                    ['goal_id', 'quarter', 'review_type'], unique=False)
+    op.create_index('ix_reviews_reviewer_id_review_type', 'reviews',
+                    ['reviewer_id', 'review_type'], unique=False)
+
+    # Progress history: a goal's history in time order
+    op.create_index('ix_goal_progress_history_goal_id_created_at', 'goal_progress_history',
+                    ['goal_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_goal_progress_history_goal_id_created_at', table_name='goal_progress_history')
+    op.drop_index('ix_reviews_reviewer_id_review_type', table_name='reviews')
+    op.drop_index('ix_reviews_goal_id_quarter_review_type', table_name='reviews')
+    op.drop_index('ix_skills_user_id_category', table_name='skills')
+    op.drop_index('ix_notifications_user_id_is_read_created_at', table_name='notifications')
+    op.drop_index('ix_users_manager_id_role', table_name='users')
+    op.drop_index('ix_goals_reviewer_id_status', table_name='goals')
+    op.drop_index('ix_goals_user_id_status', table_name='goals')
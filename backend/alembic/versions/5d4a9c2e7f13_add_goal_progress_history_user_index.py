@@ -0,0 +1,29 @@
+"""Add goal progress history user index
+
+Revision ID: 5d4a9c2e7f13
+Revises: 8b2e5f0c1d74
+Create Date: 2026-10-18 14:21:52.390417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d4a9c2e7f13'
+down_revision: Union[str, Sequence[str], None] = '8b2e5f0c1d74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves per-user time-series range scans on created_at
+    op.create_index('ix_goal_progress_history_user_id_created_at', 'goal_progress_history', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_goal_progress_history_user_id_created_at', table_name='goal_progress_history')
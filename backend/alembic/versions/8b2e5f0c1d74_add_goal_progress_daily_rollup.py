@@ -0,0 +1,44 @@
+"""Add goal progress daily rollup
+
+Revision ID: 8b2e5f0c1d74
+Revises: 3c7d1e9a4b52
+Create Date: 2026-10-18 11:03:27.184520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e5f0c1d74'
+down_revision: Union[str, Sequence[str], None] = '3c7d1e9a4b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Per-user daily sums of progress updates for the trend reports;
+    # populate it afterwards with backfill_goal_progress_daily.py
+    op.create_table('goal_progress_daily',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('progress_sum', sa.Numeric(14, 2), nullable=False),
+        sa.Column('update_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_goal_progress_daily_id'), 'goal_progress_daily', ['id'], unique=False)
+    op.create_index('ix_goal_progress_daily_user_id_day', 'goal_progress_daily', ['user_id', 'day'], unique=True)
+    op.create_index('ix_goal_progress_daily_day', 'goal_progress_daily', ['day'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_goal_progress_daily_day', table_name='goal_progress_daily')
+    op.drop_index('ix_goal_progress_daily_user_id_day', table_name='goal_progress_daily')
+    op.drop_index(op.f('ix_goal_progress_daily_id'), table_name='goal_progress_daily')
+    op.drop_table('goal_progress_daily')
@@ -0,0 +1,29 @@
+"""Add reviews created_at index
+
+Revision ID: a1f6c3b8d925
+Revises: 5d4a9c2e7f13
+Create Date: 2026-10-18 15:02:11.637904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f6c3b8d925'
+down_revision: Union[str, Sequence[str], None] = '5d4a9c2e7f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves the review summary's most recent reviews without sorting the table
+    op.create_index('ix_reviews_created_at', 'reviews', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reviews_created_at', table_name='reviews')
@@ -7,6 +7,7 @@ from .skills import router as skills_router
 from .notifications import router as notifications_router
 from .reports import router as reports_router
 from .profile import router as profile_router
+from .export import router as export_router
 
 router = APIRouter()
 
@@ -17,4 +18,5 @@ router.include_router(reviews_router, tags=["Reviews"])
 router.include_router(skills_router, prefix="/skills", tags=["Skills"])
 router.include_router(notifications_router, tags=["Notifications"])
 router.include_router(reports_router, prefix="/reports", tags=["Reports"])
-router.include_router(profile_router, prefix="/profile", tags=["Profile"]) 
\ No newline at end of file
+router.include_router(profile_router, prefix="/profile", tags=["Profile"])
+router.include_router(export_router, tags=["Export"]) 
\ No newline at end of file
@@ -0,0 +1,141 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from typing import AsyncIterator, Callable, Optional
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+import csv
+import enum
+import io
+import json
+
+from app.config.settings import settings
+from app.database import get_async_sessionmaker
+from app.models.user import User, UserRole
+from app.models.goal import Goal, GoalProgressDaily
+from app.models.review import Review
+from app.models.skill import Skill
+from app.utils.security import get_current_user
+from app.services.report_service import admin_overview_statement, admin_overview_row
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+# Table exports, streamed in primary key order
+TABLE_EXPORTS = {
+    "goals": Goal,
+    "reviews": Review,
+    "skills": Skill,
+}
+
+# Report aggregate exports: name -> (statement factory, row formatter or None).
+# The formatter types rows the way the matching JSON report does.
+REPORT_EXPORTS = {
+    "overview": (
+        lambda: admin_overview_statement(datetime.now() - timedelta(days=30)),
+        lambda row: admin_overview_row(*row),
+    ),
+    "progress-daily": (
+        lambda: select(GoalProgressDaily.__table__).order_by(GoalProgressDaily.day, GoalProgressDaily.user_id),
+        None,
+    ),
+}
+
+
+def _plain(value):
+    """Convert a column value to something CSV and JSON both render sensibly"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _csv_line(values) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+async def stream_rows(statement, export_format: str,
+                      format_row: Optional[Callable] = None) -> AsyncIterator[str]:
+    """Stream a statement's rows as CSV or NDJSON, one chunk per fetched batch.
+
+    The session is opened here rather than taken from a dependency, because
+    the body is sent after the endpoint returns. Rows come from a server-side
+    cursor in batches of EXPORT_CHUNK_SIZE, so memory stays flat no matter
+    how many rows the statement yields. format_row, if given, maps each row
+    before it is written.
+    """
+    columns = list(statement.selected_columns.keys())
+    if export_format == "csv":
+        # The header goes out before the query runs
+        yield _csv_line(columns)
+
+    async with get_async_sessionmaker()() as db:
+        # stream_results + partitions(n) rather than yield_per, which needs SQLAlchemy 1.4.40
+        result = await db.stream(statement.execution_options(stream_results=True))
+        async for partition in result.partitions(settings.EXPORT_CHUNK_SIZE):
+            if format_row is not None:
+                partition = [format_row(row) for row in partition]
+            buffer = io.StringIO()
+            if export_format == "csv":
+                writer = csv.writer(buffer)
+                for row in partition:
+                    writer.writerow([_plain(value) for value in row])
+            else:
+                for row in partition:
+                    buffer.write(json.dumps(dict(zip(columns, map(_plain, row)))))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+
+
+def _export_response(statement, export_format: str, name: str,
+                     format_row: Optional[Callable] = None) -> StreamingResponse:
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(EXPORT_FORMATS)}")
+    return StreamingResponse(
+        stream_rows(statement, export_format, format_row),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'}
+    )
+
+
+def _require_admin(current_user: User):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+
+@router.get("/reports/{report}")
+async def export_report(
+    report: str,
+    format: str = "csv",
+    current_user: User = Depends(get_current_user)
+):
+    """Stream a report's aggregate rows as CSV or NDJSON"""
+    _require_admin(current_user)
+    if report not in REPORT_EXPORTS:
+        raise HTTPException(status_code=404, detail="Report not found")
+    statement_factory, format_row = REPORT_EXPORTS[report]
+    return _export_response(statement_factory(), format, report, format_row)
+
+
+@router.get("/{table}")
+async def export_table(
+    table: str,
+    format: str = "csv",
+    current_user: User = Depends(get_current_user)
+):
+    """Stream every goal, review or skill as CSV or NDJSON"""
+    _require_admin(current_user)
+    model = TABLE_EXPORTS.get(table)
+    if model is None:
+        raise HTTPException(status_code=404, detail="Export not found")
+    statement = select(model.__table__).order_by(model.__table__.c.id)
+    return _export_response(statement, format, table)
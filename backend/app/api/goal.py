@@ -1,20 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.schemas.goal import GoalCreate, GoalUpdate, GoalResponse, GoalProgressUpdate, GoalProgressHistoryResponse
 from app.models.goal import Goal, GoalStatus, GoalProgressHistory
-from app.database import get_db
+from app.database import get_db, SessionLocal
+from app.config.settings import settings
 from app.models.user import User
 from app.utils.security import get_current_user
 from app.services.notification_service import NotificationService
-from typing import List
-from datetime import datetime
+from app.services.progress_rollup import record_progress, replace_progress
+from app.services.org_tree import subordinate_ids
+from app.services.goal_queries import with_goal_user, review_queue
+from app.services.progress_compaction import downsample, fit_points, has_comments
+from app.services.goal_import import import_goals, IMPORT_FORMATS
+from app.utils.time_buckets import BUCKETS
+from typing import List, Optional
+from datetime import datetime, timedelta
+import io
+import tempfile
 from app.schemas.goal import GoalReviewRequest
+from app.utils.pagination import keyset_paginate, build_page, NEXT_CURSOR_HEADER
+from app.utils.writes import insert_returning
 
 router = APIRouter(
     prefix="/goals",
     tags=["Goals"]
 )
 
+# Import uploads larger than this are spooled to a temporary file
+IMPORT_SPOOL_BYTES = 4 * 1024 * 1024
+
 @router.post("/", response_model=GoalResponse, status_code=status.HTTP_201_CREATED)
 def create_goal(goal: GoalCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     db_goal = Goal(
@@ -29,30 +46,56 @@ def create_goal(goal: GoalCreate, db: Session = Depends(get_db), current_user: U
         comments=goal.comments,
         reviewer_id=goal.reviewer_id
     )
-    db.add(db_goal)
+    insert_returning(db, db_goal)
     db.commit()
-    db.refresh(db_goal)
     return db_goal
 
+@router.post("/import")
+async def import_goals_file(
+    request: Request,
+    format: str = "csv",
+    start_row: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_user)
+):
+    """Bulk import goals from a CSV or JSONL request body (admins only).
+    Each row holds employee_email plus the GoalCreate fields. Rows are committed
+    in batches; resume an interrupted import by passing the last_row it reported."""
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+    if format not in IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(IMPORT_FORMATS)}")
+    
+    # Spool the upload (to disk past a few MB) so rows can be parsed one at a time
+    upload = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES)
+    async for chunk in request.stream():
+        upload.write(chunk)
+    upload.seek(0)
+    
+    def run_import():
+        db = SessionLocal()
+        try:
+            stream = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+            return import_goals(db, stream, format, start_row=start_row)
+        finally:
+            db.close()
+            upload.close()
+    
+    summary = await run_in_threadpool(run_import)
+    if summary.get("error_type") == "decode":
+        # Earlier batches are committed; last_row tells the client where to resume
+        return JSONResponse(status_code=400, content=summary)
+    if summary.get("error_type") == "batch":
+        return JSONResponse(status_code=500, content=summary)
+    return summary
+
 @router.get("/review", response_model=List[GoalResponse])
 def list_goals_for_review(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     # Only reviewers and admins can access
     if current_user.role not in ["reviewer", "admin"]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    # Get goals with user information
-    if current_user.role == "admin":
-        # Admin can see all submitted goals
-        goals = db.query(Goal).filter(Goal.status == GoalStatus.submitted).all()
-    else:
-        # Reviewers can only see goals assigned to them
-        goals = db.query(Goal).filter(Goal.reviewer_id == current_user.id, Goal.status == GoalStatus.submitted).all()
-    
-    # Add user information to each goal
-    for goal in goals:
-        goal.user = db.query(User).filter(User.id == goal.user_id).first()
-    
-    return goals
+    # Submitted goals with their owners, in one query
+    return review_queue(db, current_user)
 
 @router.post("/{goal_id}/review", response_model=GoalResponse)
 def review_goal(goal_id: int, review_request: GoalReviewRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -63,10 +106,10 @@ def review_goal(goal_id: int, review_request: GoalReviewRequest, db: Session = D
     # Find the goal
     if current_user.role == "admin":
         # Admin can review any submitted goal
-        goal = db.query(Goal).filter(Goal.id == goal_id, Goal.status == GoalStatus.submitted).first()
+        goal = with_goal_user(db.query(Goal)).filter(Goal.id == goal_id, Goal.status == GoalStatus.submitted).first()
     else:
         # Reviewers can only review goals assigned to them
-        goal = db.query(Goal).filter(Goal.id == goal_id, Goal.reviewer_id == current_user.id, Goal.status == GoalStatus.submitted).first()
+        goal = with_goal_user(db.query(Goal)).filter(Goal.id == goal_id, Goal.reviewer_id == current_user.id, Goal.status == GoalStatus.submitted).first()
     
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found or not assigned to you")
@@ -89,13 +132,14 @@ def review_goal(goal_id: int, review_request: GoalReviewRequest, db: Session = D
     notification_service.notify_goal_reviewed(goal, current_user, review_request.action)
     
     db.commit()
-    db.refresh(goal)
     return goal
 
 # Update submit_all_draft_goals to assign reviewer_id (manager_id)
 @router.post("/submit_all", status_code=200)
 def submit_all_draft_goals(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    draft_goals = db.query(Goal).filter(Goal.user_id == current_user.id, Goal.status == GoalStatus.draft).all()
+    draft_goals = db.execute(
+        select(Goal.id, Goal.title).where(Goal.user_id == current_user.id, Goal.status == GoalStatus.draft)
+    ).all()
     
     if not draft_goals:
         raise HTTPException(status_code=400, detail="No draft goals available to submit for review")
@@ -107,56 +151,69 @@ def submit_all_draft_goals(db: Session = Depends(get_db), current_user: User = D
             detail="Cannot submit goals for review. No reviewer has been assigned to you. Please contact your administrator."
         )
     
-    notification_service = NotificationService(db)
+    # Assign reviewer_id to manager_id if present, otherwise use appraiser_id
+    reviewer_id = current_user.manager_id or current_user.appraiser_id
     
-    for goal in draft_goals:
-        goal.status = GoalStatus.submitted
-        # Assign reviewer_id to manager_id if present, otherwise use appraiser_id
-        if current_user.manager_id:
-            goal.reviewer_id = current_user.manager_id
-        elif current_user.appraiser_id:
-            goal.reviewer_id = current_user.appraiser_id
-        
-        # Create notification for the reviewer
-        if goal.reviewer_id:
-            notification_service.notify_goal_submitted(goal, current_user)
+    # Submit every draft with one UPDATE and notify the reviewer with one INSERT, in one transaction
+    db.query(Goal).filter(
+        Goal.id.in_([goal_id for goal_id, _ in draft_goals]),
+        Goal.status == GoalStatus.draft
+    ).update({"status": GoalStatus.submitted, "reviewer_id": reviewer_id}, synchronize_session=False)
+    
+    notification_service = NotificationService(db)
+    notification_service.notify_goals_submitted(
+        draft_goals, reviewer_id, current_user, collapse=settings.COLLAPSE_SUBMIT_NOTIFICATIONS
+    )
     
     db.commit()
     return {"updated": len(draft_goals)}
 
 @router.get("/", response_model=List[GoalResponse])
 def list_goals(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return db.query(Goal).filter(Goal.user_id == current_user.id).all()
+    return with_goal_user(db.query(Goal)).filter(Goal.user_id == current_user.id).all()
 
 @router.get("/all", response_model=List[GoalResponse])
-def list_all_goals(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Get all goals for managers/reviewers to see their team's goals"""
+def list_all_goals(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get all goals for managers/reviewers to see their team's goals.
+    Every goal is returned unless a limit is passed; the cursor for the next
+    page is then returned in the X-Next-Cursor header."""
     if current_user.role == "admin":
         # Admin can see all goals
-        return db.query(Goal).all()
+        query = with_goal_user(db.query(Goal))
     elif current_user.role == "reviewer":
-        # Reviewer can see goals of employees under their management
+        # Reviewer can see goals of employees anywhere below them in the org tree
         from app.models.user import UserRole
-        team_employee_ids = db.query(User.id).filter(
-            User.manager_id == current_user.id,
+        employee_ids = select(User.id).where(
+            User.id.in_(subordinate_ids(current_user.id)),
             User.role == UserRole.EMPLOYEE
-        ).all()
-        employee_ids = [emp[0] for emp in team_employee_ids]
-        return db.query(Goal).filter(Goal.user_id.in_(employee_ids)).all()
+        )
+        query = with_goal_user(db.query(Goal)).filter(Goal.user_id.in_(employee_ids))
     else:
         # Employees can only see their own goals
-        return db.query(Goal).filter(Goal.user_id == current_user.id).all()
+        query = with_goal_user(db.query(Goal)).filter(Goal.user_id == current_user.id)
+    
+    columns = [Goal.id]
+    goals, next_cursor = build_page(keyset_paginate(query, columns, cursor, limit).all(), columns, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return goals
 
 @router.get("/{goal_id}", response_model=GoalResponse)
 def get_goal(goal_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    goal = db.query(Goal).filter(Goal.id == goal_id, Goal.user_id == current_user.id).first()
+    goal = with_goal_user(db.query(Goal)).filter(Goal.id == goal_id, Goal.user_id == current_user.id).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
     return goal
 
 @router.put("/{goal_id}", response_model=GoalResponse)
 def update_goal(goal_id: int, goal_update: GoalUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    goal = db.query(Goal).filter(Goal.id == goal_id, Goal.user_id == current_user.id).first()
+    goal = with_goal_user(db.query(Goal)).filter(Goal.id == goal_id, Goal.user_id == current_user.id).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
     
@@ -164,7 +221,6 @@ def update_goal(goal_id: int, goal_update: GoalUpdate, db: Session = Depends(get
         setattr(goal, field, value)
     
     db.commit()
-    db.refresh(goal)
     return goal
 
 @router.delete("/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -179,7 +235,7 @@ def delete_goal(goal_id: int, db: Session = Depends(get_db), current_user: User
 # Progress tracking endpoints
 @router.post("/{goal_id}/progress", response_model=GoalResponse)
 def update_goal_progress(goal_id: int, progress_update: GoalProgressUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    goal = db.query(Goal).filter(Goal.id == goal_id, Goal.user_id == current_user.id).first()
+    goal = with_goal_user(db.query(Goal)).filter(Goal.id == goal_id, Goal.user_id == current_user.id).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
     
@@ -187,31 +243,73 @@ def update_goal_progress(goal_id: int, progress_update: GoalProgressUpdate, db:
     if progress_update.progress < 0 or progress_update.progress > 100:
         raise HTTPException(status_code=400, detail="Progress must be between 0 and 100")
     
-    # Create progress history entry
-    progress_history = GoalProgressHistory(
-        goal_id=goal_id,
-        user_id=current_user.id,
-        progress=progress_update.progress,
-        comments=progress_update.comments
-    )
-    db.add(progress_history)
+    now = datetime.utcnow()
+    
+    # Rapid edits without comments replace the newest history row while it is inside the coalescing
+    # window. The row keeps its original created_at, so the window never slides and a run of edits
+    # still leaves at least one row per PROGRESS_COALESCE_SECONDS.
+    pending = None
+    if settings.PROGRESS_COALESCE_SECONDS > 0 and not progress_update.comments:
+        pending = db.query(GoalProgressHistory).filter(
+            GoalProgressHistory.goal_id == goal_id,
+            GoalProgressHistory.user_id == current_user.id,
+            GoalProgressHistory.created_at >= now - timedelta(seconds=settings.PROGRESS_COALESCE_SECONDS)
+        ).order_by(GoalProgressHistory.created_at.desc(), GoalProgressHistory.id.desc()).first()
+        if pending is not None and pending.comments:
+            pending = None
+    
+    if pending is not None:
+        day = pending.created_at.date()
+        replace_progress(db, current_user.id, pending.progress, day, progress_update.progress, day)
+        pending.progress = progress_update.progress
+    else:
+        # Create progress history entry
+        progress_history = GoalProgressHistory(
+            goal_id=goal_id,
+            user_id=current_user.id,
+            progress=progress_update.progress,
+            comments=progress_update.comments,
+            created_at=now
+        )
+        db.add(progress_history)
+        record_progress(db, current_user.id, progress_update.progress, now.date())
     
     # Update goal progress
     goal.progress = progress_update.progress
-    goal.progress_updated_at = datetime.utcnow()
+    goal.progress_updated_at = now
     
     db.commit()
-    db.refresh(goal)
     return goal
 
 @router.get("/{goal_id}/progress", response_model=List[GoalProgressHistoryResponse])
-def get_goal_progress_history(goal_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def get_goal_progress_history(
+    goal_id: int,
+    resolution: Optional[str] = None,
+    max_points: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Progress history, newest first. resolution (day, week, month or quarter) keeps the
+    last point per period plus commented points; max_points caps how many uncommented
+    points come back, since commented points are never dropped."""
+    if resolution is not None and resolution not in BUCKETS:
+        raise HTTPException(status_code=400, detail=f"resolution must be one of {', '.join(BUCKETS)}")
+    
     goal = db.query(Goal).filter(Goal.id == goal_id, Goal.user_id == current_user.id).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
     
-    progress_history = db.query(GoalProgressHistory).filter(
-        GoalProgressHistory.goal_id == goal_id
-    ).order_by(GoalProgressHistory.created_at.desc()).all()
+    if resolution is None and max_points is None:
+        return db.query(GoalProgressHistory).filter(
+            GoalProgressHistory.goal_id == goal_id
+        ).order_by(GoalProgressHistory.created_at.desc()).all()
     
-    return progress_history 
\ No newline at end of file
+    # Downsampling works oldest first
+    points = db.query(GoalProgressHistory).filter(
+        GoalProgressHistory.goal_id == goal_id
+    ).order_by(GoalProgressHistory.created_at, GoalProgressHistory.id).all()
+    if resolution:
+        points = downsample(points, resolution, keep=has_comments)
+    if max_points:
+        points = fit_points(points, max_points, keep=has_comments)
+    return points[::-1]
@@ -1,28 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.notification import NotificationResponse, NotificationUpdate
 from app.models.user import User
 from app.utils.security import get_current_user
 from app.services.notification_service import NotificationService
-from typing import List
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from typing import List, Optional
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 @router.get("/", response_model=List[NotificationResponse])
 def get_notifications(
+    response: Response,
     unread_only: bool = False,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get notifications for the current user."""
+    """Get notifications for the current user.
+    The cursor for the next page is returned in the X-Next-Cursor header."""
     notification_service = NotificationService(db)
-    notifications = notification_service.get_user_notifications(
+    notifications, next_cursor = notification_service.get_user_notifications(
         user_id=current_user.id,
         unread_only=unread_only,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return notifications
 
 @router.get("/unread-count")
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models.user import User
-from app.models.organization import Department, Team, Position
+from app.models.organization import Department, Team
 from app.utils.security import get_current_user
 from typing import List, Dict, Any
 
@@ -11,17 +12,22 @@ router = APIRouter()
 @router.get("/org-hierarchy")
 async def get_org_hierarchy(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get organizational hierarchy for the current user"""
     try:
         # Get user's department info (using the department string field)
         user_dept = None
         if current_user.department:
-            user_dept = db.query(Department).filter(Department.name == current_user.department).first()
+            user_dept = (await db.execute(
+                select(Department).where(Department.name == current_user.department)
+            )).scalars().first()
         
         # Get all departments with their teams
-        departments = db.query(Department).all()
+        departments = (await db.execute(select(Department))).scalars().all()
+        teams_by_department = {}
+        for team in (await db.execute(select(Team))).scalars().all():
+            teams_by_department.setdefault(team.department_id, []).append(team)
         org_structure = []
         
         for dept in departments:
@@ -34,8 +40,7 @@ async def get_org_hierarchy(
             }
             
             # Get teams for this department
-            teams = db.query(Team).filter(Team.department_id == dept.id).all()
-            for team in teams:
+            for team in teams_by_department.get(dept.id, []):
                 team_data = {
                     "id": team.id,
                     "name": team.name,
@@ -49,7 +54,6 @@ async def get_org_hierarchy(
         # Get user's position info
         user_position = None
         if user_dept:
-            positions = db.query(Position).filter(Position.department_id == user_dept.id).all()
             # For now, assign a default position based on user role
             if current_user.role == "admin":
                 user_position = "Engineering Manager"
@@ -80,22 +84,29 @@ async def get_org_hierarchy(
 @router.get("/user-profile")
 async def get_user_profile(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get detailed user profile information"""
     try:
         # Get user's department (using the department string field)
         user_dept = None
         if current_user.department:
-            user_dept = db.query(Department).filter(Department.name == current_user.department).first()
+            user_dept = (await db.execute(
+                select(Department).where(Department.name == current_user.department)
+            )).scalars().first()
         
         # Get user's manager
         manager = None
         if current_user.manager_id:
-            manager = db.query(User).filter(User.id == current_user.manager_id).first()
+            manager = (await db.execute(
+                select(User).where(User.id == current_user.manager_id)
+            )).scalars().first()
         
-        # Get user's direct reports
-        direct_reports = db.query(User).filter(User.manager_id == current_user.id).all()
+        # Get user's direct reports; only the first level, as the profile card
+        # lists who reports to the user (team-wide views use org_tree.subordinate_ids)
+        direct_reports = (await db.execute(
+            select(User).where(User.manager_id == current_user.id)
+        )).scalars().all()
         
         return {
             "id": current_user.id,
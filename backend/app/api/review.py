@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -9,12 +10,19 @@ from app.models.goal import Goal
 from app.models.review import Review, ReviewType
 from app.schemas.review import (
     ReviewCreate, ReviewUpdate, ReviewResponse, 
-    ReviewComparison, ReviewSummary
+    ReviewComparison, ReviewComparisonRow, ReviewSummary,
+    ReviewBulkCreate, ReviewBulkResponse
 )
 from app.utils.security import get_current_user
+from app.utils.pagination import keyset_paginate, build_page, NEXT_CURSOR_HEADER
+from app.utils.writes import insert_returning
+from app.services.review_service import visible_review_comparisons, create_manager_reviews
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
+# Most manager reviews accepted by one bulk request
+MAX_BULK_REVIEWS = 500
+
 @router.post("/", response_model=ReviewResponse)
 def create_review(
     review_data: ReviewCreate,
@@ -68,21 +76,48 @@ def create_review(
         areas_for_improvement=review_data.areas_for_improvement
     )
     
-    db.add(review)
+    insert_returning(db, review)
     db.commit()
-    db.refresh(review)
     
     return review
 
+@router.post("/bulk", response_model=ReviewBulkResponse)
+def create_reviews_bulk(
+    bulk_data: ReviewBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Create many manager reviews in one transaction, with a result per item"""
+    
+    if current_user.role not in [UserRole.REVIEWER, UserRole.ADMIN]:
+        raise HTTPException(
+            status_code=403, 
+            detail="Only reviewers and admins can create manager reviews"
+        )
+    if len(bulk_data.reviews) > MAX_BULK_REVIEWS:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"At most {MAX_BULK_REVIEWS} reviews can be submitted at once"
+        )
+    
+    results = create_manager_reviews(db, bulk_data.reviews, current_user)
+    failed = sum(1 for result in results if result.get("error"))
+    return ReviewBulkResponse(created=len(results) - failed, failed=failed, results=results)
+
 @router.get("/", response_model=List[ReviewResponse])
 def list_reviews(
+    response: Response,
     goal_id: Optional[int] = None,
     review_type: Optional[ReviewType] = None,
     quarter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List reviews with optional filtering"""
+    """List reviews with optional filtering, newest first.
+    Every review is returned unless a limit is passed; the cursor for the
+    next page is then returned in the X-Next-Cursor header."""
     
     query = db.query(Review)
     
@@ -109,7 +144,12 @@ def list_reviews(
         )
     # Admins can see all reviews
     
-    return query.order_by(Review.created_at.desc()).all()
+    columns = [Review.created_at, Review.id]
+    rows = keyset_paginate(query, columns, cursor, limit, descending=True).all()
+    reviews, next_cursor = build_page(rows, columns, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return reviews
 
 @router.get("/{review_id}", response_model=ReviewResponse)
 def get_review(
@@ -162,7 +202,6 @@ def update_review(
     review.updated_at = datetime.utcnow()
     
     db.commit()
-    db.refresh(review)
     
     return review
 
@@ -245,6 +284,34 @@ def get_review_comparison(
     
     return comparisons
 
+@router.get("/comparison/", response_model=List[ReviewComparisonRow])
+def get_review_comparisons(
+    response: Response,
+    quarter: str,
+    goal_ids: Optional[List[int]] = Query(None),
+    team: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Compare self-assessments with manager reviews for many goals in one quarter.
+    Pass goal_ids, or team=true for every goal in your reporting subtree.
+    The cursor for the next page is returned in the X-Next-Cursor header."""
+    
+    if not goal_ids and not team:
+        raise HTTPException(status_code=400, detail="Provide goal_ids or team=true")
+    
+    # Goals the user may not see are left out rather than failing the batch
+    statement = visible_review_comparisons(quarter, current_user, goal_ids=goal_ids or None, team=team)
+    
+    columns = [Review.goal_id]
+    rows = db.execute(keyset_paginate(statement, columns, cursor, limit)).all()
+    comparisons, next_cursor = build_page(rows, columns, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return [ReviewComparisonRow(**row._mapping) for row in comparisons]
+
 @router.get("/summary/", response_model=ReviewSummary)
 def get_review_summary(
     db: Session = Depends(get_db),
@@ -269,9 +336,13 @@ def get_review_summary(
         )
     # Admins see all reviews
     
-    reviews = query.all()
+    # Totals per review type, aggregated in the database
+    counts = query.with_entities(
+        Review.review_type, func.count(Review.id), func.sum(Review.rating)
+    ).group_by(Review.review_type).all()
     
-    if not reviews:
+    total_reviews = sum(count for _, count, _ in counts)
+    if not total_reviews:
         return ReviewSummary(
             total_reviews=0,
             average_rating=0.0,
@@ -279,20 +350,11 @@ def get_review_summary(
             recent_reviews=[]
         )
     
-    # Calculate statistics
-    total_reviews = len(reviews)
-    average_rating = sum(r.rating for r in reviews) / total_reviews
-    
-    # Group by review type
-    reviews_by_type = {}
-    for review in reviews:
-        review_type = review.review_type.value
-        if review_type not in reviews_by_type:
-            reviews_by_type[review_type] = 0
-        reviews_by_type[review_type] += 1
+    average_rating = sum(rating_sum for _, _, rating_sum in counts) / total_reviews
+    reviews_by_type = {review_type.value: count for review_type, count, _ in counts}
     
-    # Get recent reviews (last 5)
-    recent_reviews = sorted(reviews, key=lambda x: x.created_at, reverse=True)[:5]
+    # Get recent reviews (last 5) through ix_reviews_created_at
+    recent_reviews = query.order_by(Review.created_at.desc(), Review.id.desc()).limit(5).all()
     
     return ReviewSummary(
         total_reviews=total_reviews,
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_async_db
 from app.models.skill import Skill, CompetencyLevel, SkillCategory
 from app.models.user import User
 from app.schemas.skill import (
@@ -13,6 +14,9 @@ from app.schemas.skill import (
     SkillCategoryResponse
 )
 from app.utils.security import get_current_user, verify_token
+from app.utils.pagination import keyset_paginate, build_page
+from app.utils.writes import insert_returning, update_returning
+from app.services.analytics import skill_summary
 
 router = APIRouter()
 
@@ -20,15 +24,17 @@ router = APIRouter()
 async def create_skill(
     skill_data: SkillCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new skill for the current user"""
     try:
         # Check if skill with same name already exists for this user
-        existing_skill = db.query(Skill).filter(
-            Skill.user_id == current_user.id,
-            Skill.name.ilike(skill_data.name)
-        ).first()
+        existing_skill = (await db.execute(
+            select(Skill).where(
+                Skill.user_id == current_user.id,
+                Skill.name.ilike(skill_data.name)
+            )
+        )).scalars().first()
         
         if existing_skill:
             raise HTTPException(
@@ -47,13 +53,12 @@ async def create_skill(
             tags=skill_data.tags
         )
         
-        db.add(skill)
-        db.commit()
-        db.refresh(skill)
+        await db.run_sync(insert_returning, skill)
+        await db.commit()
         
         return skill
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create skill: {str(e)}"
@@ -62,37 +67,54 @@ async def create_skill(
 @router.get("/", response_model=SkillListResponse)
 async def get_skills(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-    page: int = Query(1, ge=1, description="Page number"),
+    db: AsyncSession = Depends(get_async_db),
+    page: int = Query(1, ge=1, description="Page number (ignored when a cursor is given; pages after the first return no next_cursor)"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     category: Optional[SkillCategory] = Query(None, description="Filter by category"),
     level: Optional[CompetencyLevel] = Query(None, description="Filter by competency level"),
     development_area: Optional[bool] = Query(None, description="Filter by development area")
 ):
     """Get skills for the current user with optional filtering"""
     try:
-        query = db.query(Skill).filter(Skill.user_id == current_user.id)
+        query = select(Skill).where(Skill.user_id == current_user.id)
         
         # Apply filters
         if category:
-            query = query.filter(Skill.category == category)
+            query = query.where(Skill.category == category)
         if level:
-            query = query.filter(Skill.competency_level == level)
+            query = query.where(Skill.competency_level == level)
         if development_area is not None:
-            query = query.filter(Skill.is_development_area == str(development_area).lower())
+            query = query.where(Skill.is_development_area == str(development_area).lower())
         
         # Get total count
-        total = query.count()
+        total = (await db.execute(
+            select(func.count()).select_from(query.subquery())
+        )).scalar()
         
-        # Apply pagination
-        skills = query.offset((page - 1) * size).limit(size).all()
+        # Keyset pagination from the first page or a cursor; older clients asking
+        # for page > 1 get an OFFSET page with no next_cursor, never a mix of both
+        columns = [Skill.id]
+        if cursor or page == 1:
+            rows = (await db.execute(
+                keyset_paginate(query, columns, cursor, size)
+            )).scalars().all()
+            skills, next_cursor = build_page(rows, columns, size)
+        else:
+            skills = (await db.execute(
+                query.order_by(Skill.id).offset((page - 1) * size).limit(size)
+            )).scalars().all()
+            next_cursor = None
         
         return SkillListResponse(
             skills=skills,
             total=total,
             page=page,
-            size=size
+            size=size,
+            next_cursor=next_cursor
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -103,14 +125,16 @@ async def get_skills(
 async def get_skill(
     skill_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific skill by ID"""
     try:
-        skill = db.query(Skill).filter(
-            Skill.id == skill_id,
-            Skill.user_id == current_user.id
-        ).first()
+        skill = (await db.execute(
+            select(Skill).where(
+                Skill.id == skill_id,
+                Skill.user_id == current_user.id
+            )
+        )).scalars().first()
         
         if not skill:
             raise HTTPException(
@@ -132,14 +156,16 @@ async def update_skill(
     skill_id: int,
     skill_data: SkillUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a skill"""
     try:
-        skill = db.query(Skill).filter(
-            Skill.id == skill_id,
-            Skill.user_id == current_user.id
-        ).first()
+        skill = (await db.execute(
+            select(Skill).where(
+                Skill.id == skill_id,
+                Skill.user_id == current_user.id
+            )
+        )).scalars().first()
         
         if not skill:
             raise HTTPException(
@@ -149,11 +175,13 @@ async def update_skill(
         
         # Check if name is being updated and if it conflicts with existing skill
         if skill_data.name and skill_data.name != skill.name:
-            existing_skill = db.query(Skill).filter(
-                Skill.user_id == current_user.id,
-                Skill.name.ilike(skill_data.name),
-                Skill.id != skill_id
-            ).first()
+            existing_skill = (await db.execute(
+                select(Skill).where(
+                    Skill.user_id == current_user.id,
+                    Skill.name.ilike(skill_data.name),
+                    Skill.id != skill_id
+                )
+            )).scalars().first()
             
             if existing_skill:
                 raise HTTPException(
@@ -169,14 +197,14 @@ async def update_skill(
             else:
                 setattr(skill, field, value)
         
-        db.commit()
-        db.refresh(skill)
+        await db.run_sync(update_returning, skill)
+        await db.commit()
         
         return skill
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update skill: {str(e)}"
@@ -186,14 +214,16 @@ async def update_skill(
 async def delete_skill(
     skill_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a skill"""
     try:
-        skill = db.query(Skill).filter(
-            Skill.id == skill_id,
-            Skill.user_id == current_user.id
-        ).first()
+        skill = (await db.execute(
+            select(Skill).where(
+                Skill.id == skill_id,
+                Skill.user_id == current_user.id
+            )
+        )).scalars().first()
         
         if not skill:
             raise HTTPException(
@@ -201,13 +231,13 @@ async def delete_skill(
                 detail="Skill not found"
             )
         
-        db.delete(skill)
-        db.commit()
+        await db.delete(skill)
+        await db.commit()
         
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete skill: {str(e)}"
@@ -216,51 +246,19 @@ async def delete_skill(
 @router.get("/analytics/summary", response_model=SkillAnalytics)
 async def get_skill_analytics(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get skill analytics for the current user"""
     try:
-        skills = db.query(Skill).filter(Skill.user_id == current_user.id).all()
-        
-        total_skills = len(skills)
-        development_areas = len([s for s in skills if s.is_development_area_bool])
-        expert_skills = len([s for s in skills if s.competency_level == CompetencyLevel.EXPERT])
-        intermediate_skills = len([s for s in skills if s.competency_level == CompetencyLevel.INTERMEDIATE])
-        beginner_skills = len([s for s in skills if s.competency_level == CompetencyLevel.BEGINNER])
-        
-        # Category breakdown
-        category_breakdown = []
-        for category in SkillCategory:
-            category_skills = [s for s in skills if s.category == category]
-            if category_skills:
-                # Calculate average level
-                level_scores = {
-                    CompetencyLevel.BEGINNER: 1,
-                    CompetencyLevel.INTERMEDIATE: 2,
-                    CompetencyLevel.EXPERT: 3
-                }
-                avg_score = sum(level_scores[s.competency_level] for s in category_skills) / len(category_skills)
-                
-                if avg_score >= 2.5:
-                    avg_level = "expert"
-                elif avg_score >= 1.5:
-                    avg_level = "intermediate"
-                else:
-                    avg_level = "beginner"
-                
-                category_breakdown.append(SkillCategoryResponse(
-                    category=category,
-                    count=len(category_skills),
-                    average_level=avg_level
-                ))
+        skill_rows = (await db.execute(
+            select(Skill.category, Skill.competency_level, Skill.is_development_area)
+            .where(Skill.user_id == current_user.id)
+        )).all()
         
+        summary = skill_summary(skill_rows)
         return SkillAnalytics(
-            total_skills=total_skills,
-            development_areas=development_areas,
-            expert_skills=expert_skills,
-            intermediate_skills=intermediate_skills,
-            beginner_skills=beginner_skills,
-            category_breakdown=category_breakdown
+            **{field: value for field, value in summary.items() if field != "category_breakdown"},
+            category_breakdown=[SkillCategoryResponse(**entry) for entry in summary["category_breakdown"]]
         )
     except Exception as e:
         raise HTTPException(
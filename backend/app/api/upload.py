@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models.user import User
 from app.utils.security import get_current_user
 import os
@@ -19,7 +20,7 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 async def upload_profile_picture(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Upload a profile picture for the current user.
@@ -50,8 +51,11 @@ async def upload_profile_picture(
         
         # Update user profile picture URL
         profile_picture_url = f"/api/upload/profile-picture/{unique_filename}"
+        await db.execute(
+            update(User).where(User.id == current_user.id).values(profile_picture=profile_picture_url)
+        )
+        await db.commit()
         current_user.profile_picture = profile_picture_url
-        db.commit()
         
         return {
             "message": "Profile picture uploaded successfully",
@@ -85,7 +89,7 @@ async def get_profile_picture(filename: str):
 @router.delete("/profile-picture")
 async def delete_profile_picture(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete the current user's profile picture.
@@ -105,7 +109,10 @@ async def delete_profile_picture(
         file_path.unlink()
     
     # Update user record
+    await db.execute(
+        update(User).where(User.id == current_user.id).values(profile_picture=None)
+    )
+    await db.commit()
     current_user.profile_picture = None
-    db.commit()
     
     return {"message": "Profile picture deleted successfully"} 
\ No newline at end of file
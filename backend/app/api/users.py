@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.database import get_db
 from app.schemas.user import UserResponse, UserUpdate, UserCreate
 from app.models.user import User, UserRole
 from app.utils.dependencies import get_current_user_required, get_admin_user, get_reviewer_user, get_user_by_id
 from app.utils.exceptions import raise_forbidden, raise_not_found
 from app.services.auth_service import AuthService
+from app.services.org_tree import subordinate_ids
+from app.utils.pagination import keyset_paginate, build_page, NEXT_CURSOR_HEADER
+from app.utils.writes import update_returning
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -76,11 +79,11 @@ def get_employees_under_manager(
             User.role == UserRole.EMPLOYEE
         ).all()
     else:
-        # For reviewers, return employees who have this user as their manager
+        # For reviewers, return employees anywhere below them in the org tree
         employees = db.query(User).filter(
             User.is_active == True,
             User.role == UserRole.EMPLOYEE,
-            User.manager_id == current_user.id
+            User.id.in_(subordinate_ids(current_user.id))
         ).all()
     
     return employees
@@ -110,8 +113,8 @@ def update_user_profile(
             setattr(user, field, value)
     
     # Save changes
+    update_returning(db, user)
     db.commit()
-    db.refresh(user)
     
     return user
 
@@ -136,15 +139,24 @@ def delete_user(
 
 @router.get("/", response_model=List[UserResponse])
 def get_users(
+    response: Response,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100
+    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1)
 ):
     """
     Get list of users (Admin only).
+    The cursor for the next page is returned in the X-Next-Cursor header;
+    skip is still honoured for older clients but costs an OFFSET scan.
     """
-    query = db.query(User).filter(User.is_active == True).order_by(User.id)
+    columns = [User.id]
+    query = keyset_paginate(db.query(User).filter(User.is_active == True), columns, cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
     
-    users = query.offset(skip).limit(limit).all()
+    users, next_cursor = build_page(query.all(), columns, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return users 
\ No newline at end of file
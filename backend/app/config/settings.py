@@ -18,6 +18,32 @@ class Settings:
     # CORS settings
     ALLOWED_ORIGINS: List[str] = ["*"]
     
+    # SQL instrumentation settings
+    SQL_REPEAT_WARN_THRESHOLD: int = 10  # Warn when one statement shape repeats more often in a request
+    SQL_STATS_HISTORY: int = 50          # Requests kept for the query debug endpoint
+    
+    # Report cache settings
+    REPORT_CACHE_TTL_SECONDS: int = 60
+    
+    # Rows fetched per server-side cursor batch by the streaming exports
+    EXPORT_CHUNK_SIZE: int = 1000
+    
+    # Rows validated and committed together by the bulk goal import
+    IMPORT_BATCH_SIZE: int = 500
+    
+    # Independent report queries run concurrently, each on its own pooled connection
+    PARALLEL_QUERY_LIMIT: int = 5
+    
+    # Comment-free progress updates within this many seconds of the newest history row replace its value (0 = off)
+    PROGRESS_COALESCE_SECONDS: int = 10
+    
+    # Progress history compaction: full resolution for recent rows, then daily, then weekly points
+    PROGRESS_HISTORY_FULL_DAYS: int = 30
+    PROGRESS_HISTORY_DAILY_DAYS: int = 180
+    
+    # Send one "N goals submitted" notification per reviewer instead of one per goal
+    COLLAPSE_SUBMIT_NOTIFICATIONS: bool = False
+    
     def __init__(self):
         # Override with environment variables
         if os.getenv("DATABASE_URL"):
@@ -30,6 +56,22 @@ class Settings:
             self.DEBUG = os.getenv("DEBUG").lower() == "true"
         if os.getenv("ALLOWED_ORIGINS"):
             self.ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS").split(",")
+        if os.getenv("SQL_REPEAT_WARN_THRESHOLD"):
+            self.SQL_REPEAT_WARN_THRESHOLD = int(os.getenv("SQL_REPEAT_WARN_THRESHOLD"))
+        if os.getenv("IMPORT_BATCH_SIZE"):
+            self.IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE"))
+        if os.getenv("PARALLEL_QUERY_LIMIT"):
+            self.PARALLEL_QUERY_LIMIT = int(os.getenv("PARALLEL_QUERY_LIMIT"))
+        if os.getenv("REPORT_CACHE_TTL_SECONDS"):
+            self.REPORT_CACHE_TTL_SECONDS = int(os.getenv("REPORT_CACHE_TTL_SECONDS"))
+        if os.getenv("PROGRESS_COALESCE_SECONDS"):
+            self.PROGRESS_COALESCE_SECONDS = int(os.getenv("PROGRESS_COALESCE_SECONDS"))
+        if os.getenv("PROGRESS_HISTORY_FULL_DAYS"):
+            self.PROGRESS_HISTORY_FULL_DAYS = int(os.getenv("PROGRESS_HISTORY_FULL_DAYS"))
+        if os.getenv("PROGRESS_HISTORY_DAILY_DAYS"):
+            self.PROGRESS_HISTORY_DAILY_DAYS = int(os.getenv("PROGRESS_HISTORY_DAILY_DAYS"))
+        if os.getenv("COLLAPSE_SUBMIT_NOTIFICATIONS"):
+            self.COLLAPSE_SUBMIT_NOTIFICATIONS = os.getenv("COLLAPSE_SUBMIT_NOTIFICATIONS").lower() == "true"
 
 # Create settings instance
 settings = Settings() 
\ No newline at end of file
@@ -1,7 +1,10 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.config.settings import settings
+from app.utils.query_stats import install_query_stats
+from app.utils.report_cache import install_report_cache_invalidation
 import os
 
 # Determine database URL based on environment
@@ -15,6 +18,14 @@ else:
     # Use SQLite for local development
     DATABASE_URL = settings.DATABASE_URL
 
+# Async drivers for the same database (aiosqlite for SQLite, asyncpg for PostgreSQL)
+if DATABASE_URL.startswith("sqlite://"):
+    ASYNC_DATABASE_URL = DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+elif DATABASE_URL.startswith("postgresql://"):
+    ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+else:
+    ASYNC_DATABASE_URL = DATABASE_URL
+
 # Create SQLAlchemy engine
 engine = create_engine(
     DATABASE_URL,
@@ -22,9 +33,14 @@ engine = create_engine(
     pool_pre_ping=True,   # Enable connection health checks
     pool_recycle=300,     # Recycle connections every 5 minutes
 )
+install_query_stats(engine)
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: written objects stay loaded instead of being re-selected on next access
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Committed writes through any session (sync, or the sync half of an AsyncSession) drop stale reports
+install_report_cache_invalidation(Session)
 
 # Create Base class
 Base = declarative_base()
@@ -35,4 +51,38 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+# Async engine for the async routers. It is created on first use so entry
+# points that only use the sync engine do not need an async driver installed.
+_async_engine = None
+_AsyncSessionLocal = None
+
+def get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            echo=settings.DEBUG,
+            pool_pre_ping=True,
+            pool_recycle=300,
+        )
+        install_query_stats(_async_engine.sync_engine)
+    return _async_engine
+
+def get_async_sessionmaker():
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        # expire_on_commit=False: expired attributes would need implicit IO to reload
+        _AsyncSessionLocal = sessionmaker(
+            bind=get_async_engine(),
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _AsyncSessionLocal
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -1,7 +1,12 @@
 from flask import Flask, jsonify, request
 from flask_cors import CORS
+from app.config.settings import settings
 from app.database import engine
 from app.models import Base, User
+from app.utils.memory_repository import MemoryRepository
+from app.utils.session_store import SessionStore
+from app.utils.security import create_refresh_token
+from app.utils.query_stats import start_request, finish_request, response_headers, RECENT_REQUESTS
 from sqlalchemy.orm import sessionmaker
 import os
 from datetime import datetime
@@ -74,9 +79,23 @@ initialize_database()
 app = Flask(__name__)
 CORS(app, resources={r"/api/*": {"origins": "*", "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"]}})
 
+# Per-request SQL instrumentation (query count, DB time, repeated statements)
+@app.before_request
+def start_query_stats():
+    request.environ["query_stats_token"] = start_request(f"{request.method} {request.path}")
+
+@app.after_request
+def add_query_stats_headers(response):
+    token = request.environ.pop("query_stats_token", None)
+    if token is not None:
+        stats = finish_request(token)
+        if stats is not None:
+            response.headers.update(response_headers(stats))
+    return response
+
 # Simple user data for testing (in production, use database)
-USERS = {
-    "admin@test.com": {
+USERS = MemoryRepository([
+    {
         "id": 1,
         "email": "admin@test.com",
         "password": "Password123!",
@@ -85,7 +104,7 @@ USERS = {
         "manager_id": None,
         "appraiser_id": None
     },
-    "manager@test.com": {
+    {
         "id": 2,
         "email": "manager@test.com", 
         "password": "Password123!",
@@ -94,7 +113,7 @@ USERS = {
         "manager_id": None,
         "appraiser_id": None
     },
-    "employee@test.com": {
+    {
         "id": 3,
         "email": "employee@test.com",
         "password": "Password123!",
@@ -103,10 +122,10 @@ USERS = {
         "manager_id": 2,
         "appraiser_id": 2
     }
-}
+], indexes=("role",), unique=("email",))
 
 # Mock data for other endpoints
-GOALS = [
+GOALS = MemoryRepository([
     {
         "id": 1,
         "title": "Improve Team Collaboration",
@@ -125,9 +144,9 @@ GOALS = [
         "due_date": "2024-11-30",
         "user_id": 3
     }
-]
+], indexes=("user_id", "status"))
 
-REVIEWS = [
+REVIEWS = MemoryRepository([
     {
         "id": 1,
         "goal_id": 1,
@@ -136,9 +155,9 @@ REVIEWS = [
         "comments": "Good progress on team collaboration",
         "status": "completed"
     }
-]
+], indexes=("goal_id",))
 
-NOTIFICATIONS = [
+NOTIFICATIONS = MemoryRepository([
     {
         "id": 1,
         "title": "New user registered",
@@ -163,7 +182,7 @@ NOTIFICATIONS = [
         "read": True,
         "created_at": "2024-01-15T06:45:00Z"
     }
-]
+], indexes=("read",))
 
 PENDING_REGISTRATIONS = [
     {
@@ -235,23 +254,37 @@ ORG_HIERARCHY = {
     ]
 }
 
-# Simple token validation (in production, use JWT)
+# Opaque tokens issued at login. Access tokens expire after
+# ACCESS_TOKEN_EXPIRE_MINUTES and are renewed through /api/auth/refresh with
+# the refresh token, which lasts REFRESH_TOKEN_EXPIRE_DAYS. Both stores are
+# in-process: run a single worker, and expect a restart to sign users out.
+SESSIONS = SessionStore()
+REFRESH_SESSIONS = SessionStore(
+    ttl_seconds=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+    token_factory=create_refresh_token
+)
+
+def issue_tokens(user_id):
+    return {
+        "access_token": SESSIONS.create(user_id),
+        "refresh_token": REFRESH_SESSIONS.create(user_id),
+        "token_type": "bearer",
+        "expires_in": SESSIONS.ttl_seconds
+    }
+
 def get_user_from_token(token):
-    if not token or not token.startswith('token_'):
+    if not token:
         return None
-    try:
-        # Token format: token_{user_id}_{role}
-        parts = token.split('_')
-        if len(parts) >= 3:
-            user_id = int(parts[1])
-            role = parts[2]
-            # Find user by ID and role
-            for user in USERS.values():
-                if user['id'] == user_id and user['role'] == role:
-                    return user
-    except:
-        pass
-    return None
+    user_id = SESSIONS.get_user_id(token)
+    if user_id is None:
+        return None
+    return USERS.get(user_id)
+
+def get_bearer_token():
+    auth_header = request.headers.get('Authorization')
+    if not auth_header or not auth_header.startswith('Bearer '):
+        return None
+    return auth_header.split(' ')[1]
 
 @app.route("/")
 def read_root():
@@ -274,9 +307,18 @@ def debug_info():
     return jsonify({
         "message": "Debug endpoint - new code deployed",
         "users_count": len(USERS),
-        "available_users": list(USERS.keys())
+        "available_users": [user["email"] for user in USERS]
     })
 
+# Recent SQL shapes and timings; only registered in debug mode, and admin only
+if settings.DEBUG:
+    @app.route("/api/debug/queries")
+    def debug_queries():
+        user = get_user_from_token(get_bearer_token())
+        if not user or user["role"] != "admin":
+            return jsonify({"error": "Admin access required"}), 403
+        return jsonify({"recent_requests": list(reversed(RECENT_REQUESTS))})
+
 # Auth endpoints
 @app.route("/api/auth/login", methods=["POST"])
 def login():
@@ -288,16 +330,12 @@ def login():
         if not email or not password:
             return jsonify({"error": "Email and password are required"}), 400
         
-        user = USERS.get(email)
+        user = USERS.get_by("email", email)
         if not user or user["password"] != password:
             return jsonify({"error": "Invalid credentials"}), 401
         
-        # Simple token (in production, use JWT)
-        token = f"token_{user['id']}_{user['role']}"
-        
         return jsonify({
-            "access_token": token,
-            "token_type": "bearer",
+            **issue_tokens(user["id"]),
             "user": {
                 "id": user["id"],
                 "email": user["email"],
@@ -321,19 +359,19 @@ def register():
         if not email or not password:
             return jsonify({"error": "Email and password are required"}), 400
         
-        if email in USERS:
+        if USERS.get_by("email", email):
             return jsonify({"error": "User already exists"}), 400
         
         # Add new user (in production, save to database)
-        new_user_id = len(USERS) + 1
-        USERS[email] = {
+        new_user_id = USERS.next_id()
+        USERS.add({
             "id": new_user_id,
             "email": email,
             "password": password,
             "role": role,
             "name": name,
             "department": department
-        }
+        })
         
         return jsonify({
             "message": "User registered successfully",
@@ -350,10 +388,22 @@ def register():
 
 @app.route("/api/auth/refresh", methods=["POST"])
 def refresh_token():
-    return jsonify({"message": "Token refreshed"})
+    data = request.get_json(silent=True) or {}
+    token = data.get("refresh_token")
+    user_id = REFRESH_SESSIONS.get_user_id(token) if token else None
+    # Refresh tokens are single use: revoking first means a replayed token fails
+    if user_id is None or not REFRESH_SESSIONS.revoke(token) or USERS.get(user_id) is None:
+        return jsonify({"error": "Invalid refresh token"}), 401
+    return jsonify(issue_tokens(user_id))
 
 @app.route("/api/auth/logout", methods=["POST"])
 def logout():
+    token = get_bearer_token()
+    if token:
+        SESSIONS.revoke(token)
+    refresh = (request.get_json(silent=True) or {}).get("refresh_token")
+    if refresh:
+        REFRESH_SESSIONS.revoke(refresh)
     return jsonify({"message": "Logged out successfully"})
 
 @app.route("/api/auth/me", methods=["GET"])
@@ -364,10 +414,7 @@ def get_current_user():
             return jsonify({"error": "Authorization header required"}), 401
         
         token = auth_header.split(' ')[1]
-        print(f"Debug: Received token: {token}")  # Debug line
-        
         user = get_user_from_token(token)
-        print(f"Debug: Found user: {user}")  # Debug line
         
         if not user:
             return jsonify({"error": "Invalid token"}), 401
@@ -401,7 +448,7 @@ def get_users():
     try:
         # Return list of users (without passwords)
         users_list = []
-        for email, user in USERS.items():
+        for user in USERS:
             users_list.append({
                 "id": user["id"],
                 "email": user["email"],
@@ -416,28 +463,29 @@ def get_users():
 @app.route("/api/users/<int:user_id>", methods=["GET", "PUT", "DELETE"])
 def manage_user(user_id):
     if request.method == "GET":
-        for user in USERS.values():
-            if user["id"] == user_id:
-                return jsonify(user)
+        user = USERS.get(user_id)
+        if user:
+            return jsonify(user)
         return jsonify({"error": "User not found"}), 404
     
     elif request.method == "PUT":
         try:
             data = request.get_json()
-            for email, user in USERS.items():
-                if user["id"] == user_id:
-                    user.update(data)
-                    return jsonify({"message": "User updated successfully", "user": user})
+            user = USERS.update(user_id, data)
+            if user:
+                return jsonify({"message": "User updated successfully", "user": user})
             return jsonify({"error": "User not found"}), 404
+        except KeyError as e:
+            return jsonify({"error": e.args[0]}), 400
         except Exception as e:
             return jsonify({"error": str(e)}), 500
     
     elif request.method == "DELETE":
         try:
-            for email, user in list(USERS.items()):
-                if user["id"] == user_id:
-                    del USERS[email]
-                    return jsonify({"message": "User deleted successfully"})
+            if USERS.remove(user_id):
+                SESSIONS.revoke_user(user_id)
+                REFRESH_SESSIONS.revoke_user(user_id)
+                return jsonify({"message": "User deleted successfully"})
             return jsonify({"error": "User not found"}), 404
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -488,20 +536,19 @@ def approve_user(user_id):
 @app.route("/api/users/reviewers", methods=["GET"])
 def get_reviewers():
     reviewers = []
-    for user in USERS.values():
-        if user["role"] in ["admin", "reviewer"]:
-            reviewers.append({
-                "id": user["id"],
-                "name": user["name"],
-                "email": user["email"],
-                "role": user["role"],
-                "department": user.get("department", "")
-            })
+    for user in USERS.find(role="admin") + USERS.find(role="reviewer"):
+        reviewers.append({
+            "id": user["id"],
+            "name": user["name"],
+            "email": user["email"],
+            "role": user["role"],
+            "department": user.get("department", "")
+        })
     return jsonify(reviewers)
 
 @app.route("/api/users/employees", methods=["GET"])
 def get_employees():
-    employees = [user for user in USERS.values() if user["role"] == "employee"]
+    employees = USERS.find(role="employee")
     return jsonify(employees)
 
 # Profile endpoints
@@ -532,7 +579,7 @@ def get_user_profile():
             "years_experience": 0,
             "company_years": 0,
             "direct_reports": 0,
-            "active_goals": len([g for g in GOALS if g["user_id"] == user["id"] and g["status"] == "in_progress"])
+            "active_goals": GOALS.count(user_id=user["id"], status="in_progress")
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -545,18 +592,17 @@ def get_org_hierarchy():
 @app.route("/api/notifications/", methods=["GET"])
 def get_notifications():
     limit = request.args.get('limit', 10, type=int)
-    return jsonify(NOTIFICATIONS[:limit])
+    return jsonify(NOTIFICATIONS.all()[:limit])
 
 @app.route("/api/notifications/unread-count", methods=["GET"])
 def get_unread_count():
-    unread_count = len([n for n in NOTIFICATIONS if not n["read"]])
+    unread_count = NOTIFICATIONS.count(read=False)
     return jsonify({"unread_count": unread_count})
 
 @app.route("/api/notifications/<int:notification_id>", methods=["PUT"])
 def mark_notification_read(notification_id):
-    notification = next((n for n in NOTIFICATIONS if n["id"] == notification_id), None)
+    notification = NOTIFICATIONS.update(notification_id, {"read": True})
     if notification:
-        notification["read"] = True
         return jsonify({"message": "Notification marked as read"})
     return jsonify({"error": "Notification not found"}), 404
 
@@ -568,8 +614,8 @@ def mark_notification_read_alt(notification_id):
 def mark_all_notifications_read():
     try:
         # Mark all notifications as read
-        for notification in NOTIFICATIONS:
-            notification["read"] = True
+        for notification in NOTIFICATIONS.find(read=False):
+            NOTIFICATIONS.update(notification["id"], {"read": True})
         
         return jsonify({"message": "All notifications marked as read"})
     except Exception as e:
@@ -606,15 +652,15 @@ def get_pending_registrations():
 # Goals endpoints
 @app.route("/api/goals/", methods=["GET"])
 def get_goals():
-    return jsonify(GOALS)
+    return jsonify(GOALS.all())
 
 @app.route("/api/goals/all", methods=["GET"])
 def get_all_goals():
-    return jsonify(GOALS)
+    return jsonify(GOALS.all())
 
 @app.route("/api/goals/<int:goal_id>", methods=["GET"])
 def get_goal_by_id(goal_id):
-    goal = next((g for g in GOALS if g["id"] == goal_id), None)
+    goal = GOALS.get(goal_id)
     if goal:
         return jsonify(goal)
     return jsonify({"error": "Goal not found"}), 404
@@ -624,12 +670,12 @@ def create_goal():
     try:
         data = request.get_json()
         new_goal = {
-            "id": len(GOALS) + 1,
+            "id": GOALS.next_id(),
             **data,
             "status": "draft",
             "progress": 0
         }
-        GOALS.append(new_goal)
+        GOALS.add(new_goal)
         return jsonify(new_goal)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -638,9 +684,8 @@ def create_goal():
 def update_goal(goal_id):
     try:
         data = request.get_json()
-        goal = next((g for g in GOALS if g["id"] == goal_id), None)
+        goal = GOALS.update(goal_id, data)
         if goal:
-            goal.update(data)
             return jsonify(goal)
         return jsonify({"error": "Goal not found"}), 404
     except Exception as e:
@@ -648,23 +693,24 @@ def update_goal(goal_id):
 
 @app.route("/api/goals/<int:goal_id>", methods=["DELETE"])
 def delete_goal(goal_id):
-    global GOALS
-    GOALS = [g for g in GOALS if g["id"] != goal_id]
+    GOALS.remove(goal_id)
     return jsonify({"message": "Goal deleted successfully"})
 
 @app.route("/api/goals/submit_all", methods=["POST"])
 def submit_all_goals():
     try:
         # Get all draft goals for the current user
-        draft_goals = [g for g in GOALS if g.get("status") == "draft"]
+        draft_goals = GOALS.find(status="draft")
         
         if not draft_goals:
             return jsonify({"error": "No draft goals found"}), 400
         
         # Update all draft goals to submitted status
         for goal in draft_goals:
-            goal["status"] = "submitted"
-            goal["submitted_at"] = "2024-01-15T10:30:00Z"
+            GOALS.update(goal["id"], {
+                "status": "submitted",
+                "submitted_at": "2024-01-15T10:30:00Z"
+            })
         
         return jsonify({
             "message": f"Successfully submitted {len(draft_goals)} goals for review",
@@ -714,7 +760,7 @@ def submit_goals_for_review():
 
 @app.route("/api/goals/<int:goal_id>/progress", methods=["GET"])
 def get_goal_progress(goal_id):
-    goal = next((g for g in GOALS if g["id"] == goal_id), None)
+    goal = GOALS.get(goal_id)
     if goal:
         return jsonify({"progress": goal.get("progress", 0)})
     return jsonify({"error": "Goal not found"}), 404
@@ -723,9 +769,9 @@ def get_goal_progress(goal_id):
 def update_goal_progress(goal_id):
     try:
         data = request.get_json()
-        goal = next((g for g in GOALS if g["id"] == goal_id), None)
+        goal = GOALS.get(goal_id)
         if goal:
-            goal["progress"] = data.get("progress", goal.get("progress", 0))
+            GOALS.update(goal_id, {"progress": data.get("progress", goal.get("progress", 0))})
             return jsonify(goal)
         return jsonify({"error": "Goal not found"}), 404
     except Exception as e:
@@ -733,7 +779,7 @@ def update_goal_progress(goal_id):
 
 @app.route("/api/goals/review", methods=["GET"])
 def get_goals_for_review():
-    return jsonify([g for g in GOALS if g["status"] == "pending_review"])
+    return jsonify(GOALS.find(status="pending_review"))
 
 @app.route("/api/goals/<int:goal_id>/review", methods=["POST"])
 def review_goal(goal_id):
@@ -749,21 +795,21 @@ def create_review():
     try:
         data = request.get_json()
         new_review = {
-            "id": len(REVIEWS) + 1,
+            "id": REVIEWS.next_id(),
             **data
         }
-        REVIEWS.append(new_review)
+        REVIEWS.add(new_review)
         return jsonify(new_review)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/reviews/", methods=["GET"])
 def get_reviews():
-    return jsonify(REVIEWS)
+    return jsonify(REVIEWS.all())
 
 @app.route("/api/reviews/<int:review_id>", methods=["GET"])
 def get_review_by_id(review_id):
-    review = next((r for r in REVIEWS if r["id"] == review_id), None)
+    review = REVIEWS.get(review_id)
     if review:
         return jsonify(review)
     return jsonify({"error": "Review not found"}), 404
@@ -772,9 +818,8 @@ def get_review_by_id(review_id):
 def update_review(review_id):
     try:
         data = request.get_json()
-        review = next((r for r in REVIEWS if r["id"] == review_id), None)
+        review = REVIEWS.update(review_id, data)
         if review:
-            review.update(data)
             return jsonify(review)
         return jsonify({"error": "Review not found"}), 404
     except Exception as e:
@@ -782,8 +827,7 @@ def update_review(review_id):
 
 @app.route("/api/reviews/<int:review_id>", methods=["DELETE"])
 def delete_review(review_id):
-    global REVIEWS
-    REVIEWS = [r for r in REVIEWS if r["id"] != review_id]
+    REVIEWS.remove(review_id)
     return jsonify({"message": "Review deleted successfully"})
 
 @app.route("/api/reviews/comparison/<int:goal_id>", methods=["GET"])
@@ -798,24 +842,14 @@ def get_reviews_summary():
 @app.route("/api/reports/admin/overview", methods=["GET"])
 def get_admin_overview():
     # Count users by role
-    users_by_role = []
-    role_counts = {}
-    for user in USERS.values():
-        role = user["role"]
-        role_counts[role] = role_counts.get(role, 0) + 1
-    
-    for role, count in role_counts.items():
-        users_by_role.append({"role": role, "count": count})
+    users_by_role = [
+        {"role": role, "count": count} for role, count in USERS.group_counts("role").items()
+    ]
     
     # Count goals by status
-    goals_by_status = []
-    status_counts = {}
-    for goal in GOALS:
-        status = goal["status"]
-        status_counts[status] = status_counts.get(status, 0) + 1
-    
-    for status, count in status_counts.items():
-        goals_by_status.append({"status": status, "count": count})
+    goals_by_status = [
+        {"status": status, "count": count} for status, count in GOALS.group_counts("status").items()
+    ]
     
     # Calculate average progress
     total_progress = sum(goal.get("progress", 0) for goal in GOALS)
@@ -881,7 +915,7 @@ def get_manager_team_overview():
 
 @app.route("/api/reports/manager/team-members", methods=["GET"])
 def get_team_members():
-    employees = [user for user in USERS.values() if user["role"] == "employee"]
+    employees = USERS.find(role="employee")
     return jsonify(employees)
 
 @app.route("/api/reports/trends/goal-progress", methods=["GET"])
@@ -906,14 +940,14 @@ def get_competency_matrix():
 
 @app.route("/api/goals", methods=["GET"])
 def get_goals_simple():
-    return jsonify(GOALS)
+    return jsonify(GOALS.all())
 
 @app.route("/api/reports", methods=["GET"])
 def get_reports_simple():
     return jsonify({
         "performance_summary": {
             "total_goals": len(GOALS),
-            "completed_goals": len([g for g in GOALS if g["status"] == "completed"]),
+            "completed_goals": GOALS.count(status="completed"),
             "average_progress": sum(g.get("progress", 0) for g in GOALS) / len(GOALS) if GOALS else 0
         },
         "recent_activities": [
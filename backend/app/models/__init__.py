@@ -1,5 +1,5 @@
 from .user import User, UserRole, ApprovalStatus
-from .goal import Goal, GoalStatus, GoalProgressHistory
+from .goal import Goal, GoalStatus, GoalProgressHistory, GoalProgressDaily
 from .review import Review, ReviewType
 from .skill import Skill, SkillCategory, CompetencyLevel
 from .notification import Notification, NotificationType
@@ -8,7 +8,7 @@ from app.database import Base
 
 __all__ = [
     "User", "UserRole", "ApprovalStatus",
-    "Goal", "GoalStatus", "GoalProgressHistory", 
+    "Goal", "GoalStatus", "GoalProgressHistory", "GoalProgressDaily",
     "Review", "ReviewType",
     "Skill", "SkillCategory", "CompetencyLevel",
     "Notification", "NotificationType",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Enum, Numeric, DateTime
+from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Enum, Numeric, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
@@ -12,6 +12,10 @@ class GoalStatus(enum.Enum):
 
 class Goal(Base):
     __tablename__ = "goals"
+    __table_args__ = (
+        Index("ix_goals_user_id_status", "user_id", "status"),
+        Index("ix_goals_reviewer_id_status", "reviewer_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -33,10 +37,28 @@ class Goal(Base):
 
 class GoalProgressHistory(Base):
     __tablename__ = "goal_progress_history"
+    __table_args__ = (
+        Index("ix_goal_progress_history_goal_id_created_at", "goal_id", "created_at"),
+        Index("ix_goal_progress_history_user_id_created_at", "user_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     goal_id = Column(Integer, ForeignKey("goals.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     progress = Column(Numeric(5, 2), nullable=False)  # 0.00 to 100.00
     comments = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False) 
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+# Per-user daily rollup of progress updates, maintained as updates arrive
+class GoalProgressDaily(Base):
+    __tablename__ = "goal_progress_daily"
+    __table_args__ = (
+        Index("ix_goal_progress_daily_user_id_day", "user_id", "day", unique=True),
+        Index("ix_goal_progress_daily_day", "day"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    progress_sum = Column(Numeric(14, 2), nullable=False, default=0)
+    update_count = Column(Integer, nullable=False, default=0)
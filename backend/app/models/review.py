@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Enum, Numeric, DateTime
+from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Enum, Numeric, DateTime, Index
 from app.database import Base
 import enum
 from datetime import datetime
@@ -9,6 +9,11 @@ class ReviewType(enum.Enum):
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index("ix_reviews_goal_id_quarter_review_type", "goal_id", "quarter", "review_type"),
+        Index("ix_reviews_reviewer_id_review_type", "reviewer_id", "review_type"),
+        Index("ix_reviews_created_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     goal_id = Column(Integer, ForeignKey("goals.id"), nullable=False)
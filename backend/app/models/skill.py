@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -19,6 +19,9 @@ class SkillCategory(str, enum.Enum):
 
 class Skill(Base):
     __tablename__ = "skills"
+    __table_args__ = (
+        Index("ix_skills_user_id_category", "user_id", "category"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, Text, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -17,6 +17,9 @@ class ApprovalStatus(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_manager_id_role", "manager_id", "role"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(String(20), unique=True, nullable=True, index=True)
@@ -42,6 +42,32 @@ class ReviewComparison(BaseModel):
     manager_review: Optional[ReviewResponse] = None
     rating_difference: Optional[int] = None  # manager_rating - self_rating
 
+class ReviewComparisonRow(BaseModel):
+    goal_id: int
+    goal_title: str
+    user_id: int
+    quarter: str
+    self_assessment_id: Optional[int] = None
+    self_rating: Optional[int] = None
+    manager_review_id: Optional[int] = None
+    manager_rating: Optional[int] = None
+    rating_difference: Optional[int] = None  # manager_rating - self_rating
+
+class ReviewBulkCreate(BaseModel):
+    reviews: List[ReviewBase] = Field(..., description="Manager reviews to create")
+
+class ReviewBulkResult(BaseModel):
+    index: int  # position in the submitted list
+    goal_id: int
+    quarter: str
+    review_id: Optional[int] = None
+    error: Optional[str] = None
+
+class ReviewBulkResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[ReviewBulkResult]
+
 class ReviewSummary(BaseModel):
     total_reviews: int
     average_rating: float
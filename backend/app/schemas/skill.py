@@ -48,6 +48,7 @@ class SkillListResponse(BaseModel):
     total: int
     page: int
     size: int
+    next_cursor: Optional[str] = None
 
 class SkillCategoryResponse(BaseModel):
     category: SkillCategory
@@ -0,0 +1,216 @@
+from itertools import chain
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select, case, cast, Float
+
+from app.models.user import User
+from app.models.goal import Goal
+from app.models.review import Review, ReviewType
+from app.models.skill import Skill, SkillCategory, CompetencyLevel
+
+# Percentiles reported for every distribution
+DEFAULT_PERCENTILES = (25, 50, 75, 90)
+
+# Competency levels in score order (beginner = 1 ... expert = 3)
+COMPETENCY_LEVELS = [CompetencyLevel.BEGINNER, CompetencyLevel.INTERMEDIATE, CompetencyLevel.EXPERT]
+SKILL_CATEGORIES = list(SkillCategory)
+
+
+def department_stats_statements() -> Dict[str, Any]:
+    """The column-only queries the department statistics are computed from.
+
+    Every value column comes back as a number so rows convert to arrays in one pass.
+    """
+    level_index = case(
+        *[(Skill.competency_level == level, index) for index, level in enumerate(COMPETENCY_LEVELS)]
+    )
+    return {
+        "users": select(User.id, User.department).where(User.department.isnot(None)),
+        "goals": select(Goal.user_id, cast(Goal.progress, Float)),
+        "ratings": (
+            select(Goal.user_id, Review.rating)
+            .join(Goal, Goal.id == Review.goal_id)
+            .where(Review.review_type == ReviewType.manager_review)
+        ),
+        "skills": select(Skill.user_id, level_index),
+    }
+
+
+def grouped_distribution(codes: np.ndarray, values: np.ndarray, group_count: int,
+                         percentiles: Sequence[int] = DEFAULT_PERCENTILES) -> Dict[str, np.ndarray]:
+    """Count, mean, standard deviation, min, max and percentiles of values per group.
+
+    Every statistic is computed for all groups at once: sums through
+    bincount, and order statistics by sorting on (group, value) and indexing
+    each group's slice with linear interpolation, as numpy.percentile does.
+    Groups without values get NaN.
+    """
+    counts = np.bincount(codes, minlength=group_count)
+    present = counts > 0
+    safe_counts = np.where(present, counts, 1)
+
+    sums = np.bincount(codes, weights=values, minlength=group_count)
+    squares = np.bincount(codes, weights=values * values, minlength=group_count)
+    means = sums / safe_counts
+    variances = np.maximum(squares / safe_counts - means * means, 0.0)
+
+    order = np.lexsort((values, codes))
+    ordered = values[order]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    last = np.maximum(counts - 1, 0)
+
+    def at_fraction(fraction: float) -> np.ndarray:
+        position = starts + last * fraction
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        if ordered.size == 0:
+            return np.full(group_count, np.nan)
+        lower = np.minimum(lower, ordered.size - 1)
+        upper = np.minimum(upper, ordered.size - 1)
+        result = ordered[lower] + (ordered[upper] - ordered[lower]) * (position - np.floor(position))
+        return np.where(present, result, np.nan)
+
+    missing = np.where(present, 1.0, np.nan)
+    return {
+        "count": counts,
+        "mean": means * missing,
+        "std": np.sqrt(variances) * missing,
+        "min": at_fraction(0.0),
+        "max": at_fraction(1.0),
+        "percentiles": {p: at_fraction(p / 100) for p in percentiles},
+    }
+
+
+def _user_codes(user_rows: Sequence[Tuple[int, str]]) -> Tuple[List[str], np.ndarray]:
+    """Map user ids to department codes through a dense lookup array (-1 = no department)"""
+    if not user_rows:
+        return [], np.full(1, -1, dtype=np.int64)
+    # Departments are few, so a dict encodes them faster than sorting every label
+    index: Dict[str, int] = {}
+    user_ids = np.fromiter((row[0] for row in user_rows), dtype=np.int64, count=len(user_rows))
+    codes = np.fromiter(
+        (index.setdefault(row[1], len(index)) for row in user_rows), dtype=np.int64, count=len(user_rows)
+    )
+    departments = sorted(index)
+    ranks = np.empty(len(index), dtype=np.int64)
+    ranks[[index[department] for department in departments]] = np.arange(len(departments))
+    lookup = np.full(user_ids.max() + 1, -1, dtype=np.int64)
+    lookup[user_ids] = ranks[codes]
+    return departments, lookup
+
+
+def _department_values(lookup: np.ndarray, rows) -> Tuple[np.ndarray, np.ndarray]:
+    """Department codes and values for numeric (user_id, value) rows of users with a department"""
+    columns = np.fromiter(chain.from_iterable(rows), dtype=np.float64, count=2 * len(rows)).reshape(-1, 2)
+    user_ids = columns[:, 0].astype(np.int64)
+    values = columns[:, 1]
+    known = user_ids < lookup.size
+    codes = np.full(user_ids.size, -1, dtype=np.int64)
+    codes[known] = lookup[user_ids[known]]
+    keep = codes >= 0
+    return codes[keep], values[keep]
+
+
+def _round(value) -> Any:
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def _distribution_entries(departments: List[str], stats: Dict[str, Any]) -> List[Dict[str, Any]]:
+    entries = []
+    for index, department in enumerate(departments):
+        if not stats["count"][index]:
+            continue
+        entry = {
+            "department": department,
+            "count": int(stats["count"][index]),
+            "mean": _round(stats["mean"][index]),
+            "median": _round(stats["percentiles"][50][index]) if 50 in stats["percentiles"] else None,
+            "std": _round(stats["std"][index]),
+            "min": _round(stats["min"][index]),
+            "max": _round(stats["max"][index]),
+        }
+        for percentile, values in stats["percentiles"].items():
+            entry[f"p{percentile}"] = _round(values[index])
+        entries.append(entry)
+    return entries
+
+
+def department_stats(user_rows, goal_rows, rating_rows, skill_rows) -> Dict[str, Any]:
+    """Department distributions from the rows of department_stats_statements()"""
+    departments, lookup = _user_codes(user_rows)
+    department_count = len(departments)
+    user_counts = np.bincount(lookup[lookup >= 0], minlength=department_count)
+
+    goal_codes, progress = _department_values(lookup, goal_rows)
+    progress_stats = grouped_distribution(goal_codes, progress, department_count)
+
+    rating_codes, ratings = _department_values(lookup, rating_rows)
+    rating_stats = grouped_distribution(rating_codes, ratings, department_count)
+
+    skill_codes, levels = _department_values(lookup, skill_rows)
+    histogram = np.bincount(
+        skill_codes * len(COMPETENCY_LEVELS) + levels.astype(np.int64),
+        minlength=department_count * len(COMPETENCY_LEVELS)
+    ).reshape(department_count, len(COMPETENCY_LEVELS))
+
+    return {
+        "users_by_department": [
+            {"department": department, "count": int(user_counts[index])}
+            for index, department in enumerate(departments)
+        ],
+        "progress_by_department": [
+            dict(entry, avg_progress=entry["mean"])
+            for entry in _distribution_entries(departments, progress_stats)
+        ],
+        "ratings_by_department": _distribution_entries(departments, rating_stats),
+        "skills_by_department": [
+            {
+                "department": department,
+                "skill_count": int(histogram[index].sum()),
+                "competency_histogram": {
+                    level.value: int(count) for level, count in zip(COMPETENCY_LEVELS, histogram[index])
+                }
+            }
+            for index, department in enumerate(departments) if histogram[index].sum()
+        ],
+    }
+
+
+def skill_summary(skill_rows) -> Dict[str, Any]:
+    """Level counts and per-category average level for (category, competency_level, is_development_area) rows"""
+    level_index = {level: index for index, level in enumerate(COMPETENCY_LEVELS)}
+    category_index = {category: index for index, category in enumerate(SKILL_CATEGORIES)}
+    count = len(skill_rows)
+    levels = np.fromiter((level_index[row[1]] for row in skill_rows), dtype=np.int64, count=count)
+    categories = np.fromiter((category_index[row[0]] for row in skill_rows), dtype=np.int64, count=count)
+    development = np.fromiter(
+        ((row[2] or "").lower() == "true" for row in skill_rows), dtype=bool, count=count
+    )
+
+    level_counts = np.bincount(levels, minlength=len(COMPETENCY_LEVELS))
+    category_counts = np.bincount(categories, minlength=len(SKILL_CATEGORIES))
+    # Scores are 1-based: beginner = 1, intermediate = 2, expert = 3
+    category_scores = np.bincount(categories, weights=levels + 1, minlength=len(SKILL_CATEGORIES))
+
+    breakdown = []
+    for index, category in enumerate(SKILL_CATEGORIES):
+        if not category_counts[index]:
+            continue
+        average = category_scores[index] / category_counts[index]
+        if average >= 2.5:
+            average_level = "expert"
+        elif average >= 1.5:
+            average_level = "intermediate"
+        else:
+            average_level = "beginner"
+        breakdown.append({"category": category, "count": int(category_counts[index]), "average_level": average_level})
+
+    return {
+        "total_skills": count,
+        "development_areas": int(development.sum()),
+        "expert_skills": int(level_counts[level_index[CompetencyLevel.EXPERT]]),
+        "intermediate_skills": int(level_counts[level_index[CompetencyLevel.INTERMEDIATE]]),
+        "beginner_skills": int(level_counts[level_index[CompetencyLevel.BEGINNER]]),
+        "category_breakdown": breakdown,
+    }
@@ -10,6 +10,7 @@ from app.utils.security import (
 from datetime import timedelta, datetime
 from typing import Optional
 from fastapi import HTTPException, status
+from app.utils.writes import insert_returning, update_returning
 
 class AuthService:
     def __init__(self, db: Session):
@@ -67,9 +68,8 @@ class AuthService:
             is_active=False  # Inactive until approved
         )
         
-        self.db.add(db_user)
+        insert_returning(self.db, db_user)
         self.db.commit()
-        self.db.refresh(db_user)
         
         return db_user
     
@@ -100,9 +100,8 @@ class AuthService:
             is_active=True
         )
         
-        self.db.add(db_user)
+        insert_returning(self.db, db_user)
         self.db.commit()
-        self.db.refresh(db_user)
         
         return db_user
     
@@ -128,8 +127,8 @@ class AuthService:
         if approval_status == ApprovalStatus.APPROVED:
             user.is_active = True
         
+        update_returning(self.db, user)
         self.db.commit()
-        self.db.refresh(user)
         
         return user
     
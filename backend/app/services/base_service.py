@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
-from typing import TypeVar, Generic, Type, Optional, List
-from sqlalchemy import and_
+from typing import TypeVar, Generic, Type, Optional, List, Tuple, Iterable, Sequence
+from sqlalchemy import and_, insert, update, delete, bindparam
 from app.utils.exceptions import raise_not_found
+from app.utils.pagination import keyset_paginate, build_page
+from app.utils.writes import insert_returning, update_returning, supports_returning
 
 T = TypeVar('T')
 
@@ -23,16 +25,20 @@ class BaseService(Generic[T]):
             raise raise_not_found(f"{self.model.__name__} not found")
         return record
     
+    def get_page(self, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[T], Optional[str]]:
+        """Get a page of records ordered by ID and the cursor for the next page"""
+        columns = [self.model.id]
+        rows = keyset_paginate(self.db.query(self.model), columns, cursor, limit).all()
+        return build_page(rows, columns, limit)
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
-        """Get all records with pagination"""
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+        """Get all records with pagination (OFFSET based; prefer get_page for deep pages)"""
+        return self.db.query(self.model).order_by(self.model.id).offset(skip).limit(limit).all()
     
     def create(self, **kwargs) -> T:
         """Create a new record"""
-        record = self.model(**kwargs)
-        self.db.add(record)
+        record = insert_returning(self.db, self.model(**kwargs))
         self.db.commit()
-        self.db.refresh(record)
         return record
     
     def update(self, id: int, **kwargs) -> T:
@@ -43,8 +49,8 @@ class BaseService(Generic[T]):
             if hasattr(record, field) and value is not None:
                 setattr(record, field, value)
         
+        update_returning(self.db, record)
         self.db.commit()
-        self.db.refresh(record)
         return record
     
     def delete(self, id: int) -> bool:
@@ -54,6 +60,80 @@ class BaseService(Generic[T]):
         self.db.commit()
         return True
     
+    def bulk_create(self, rows: List[dict], return_ids: bool = False, chunk_size: int = 500,
+                    key: Sequence[str] = ()) -> Optional[List[int]]:
+        """Insert many records with multi-row INSERTs in a single transaction.
+        
+        Every row must set the same columns. With return_ids the generated IDs
+        come back in row order. RETURNING does not promise rows in VALUES order,
+        so return_ids requires key, columns whose values are unique within the
+        batch, and each returned id is matched to its row by them. Databases
+        without RETURNING insert one row per statement to read each id.
+        """
+        if return_ids and not key:
+            raise ValueError("bulk_create(return_ids=True) needs key columns that are unique within the batch")
+        table = self.model.__table__
+        key_columns = [table.c[name] for name in key]
+        ids = []
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                if not return_ids:
+                    self.db.execute(insert(table).values(chunk))
+                elif supports_returning(self.db):
+                    result = self.db.execute(
+                        insert(table).values(chunk).returning(table.c.id, *key_columns)
+                    )
+                    id_by_key = {tuple(row[1:]): row[0] for row in result}
+                    if len(id_by_key) != len(chunk):
+                        raise ValueError(f"bulk_create key {tuple(key)} is not unique within the batch")
+                    ids.extend(id_by_key[tuple(row[name] for name in key)] for row in chunk)
+                else:
+                    for row in chunk:
+                        result = self.db.execute(insert(table).values(**row))
+                        ids.append(result.inserted_primary_key[0])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return ids if return_ids else None
+    
+    def bulk_update(self, rows: List[dict]) -> int:
+        """Update many records by ID with one executemany UPDATE in a single transaction.
+        
+        Each row holds "id" plus the columns to set; every row must set the same columns.
+        """
+        if not rows:
+            return 0
+        table = self.model.__table__
+        statement = update(table).where(table.c.id == bindparam("_id"))
+        params = [
+            {"_id": row["id"], **{field: value for field, value in row.items() if field != "id"}}
+            for row in rows
+        ]
+        try:
+            result = self.db.execute(statement, params)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return result.rowcount
+    
+    def bulk_delete(self, ids: Iterable[int], chunk_size: int = 500) -> int:
+        """Delete many records by ID with set-based DELETEs in a single transaction"""
+        ids = list(ids)
+        table = self.model.__table__
+        deleted = 0
+        try:
+            for start in range(0, len(ids), chunk_size):
+                result = self.db.execute(delete(table).where(table.c.id.in_(ids[start:start + chunk_size])))
+                deleted += result.rowcount
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return deleted
+    
     def filter_by(self, **kwargs) -> List[T]:
         """Filter records by given criteria"""
         filters = []
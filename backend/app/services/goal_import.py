@@ -0,0 +1,204 @@
+import csv
+import json
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.goal import Goal, GoalStatus
+from app.models.user import User
+from app.schemas.goal import GoalCreate
+from app.services.base_service import BaseService
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+# Errors kept in an import summary; failures past this are only counted
+MAX_REPORTED_ERRORS = 1000
+
+# Column holding the goal owner's email; every other column is a GoalCreate field
+EMAIL_FIELD = "employee_email"
+
+# Length limits of the goal's string columns, checked before insert so one long value cannot fail a batch
+_LENGTH_LIMITS = {
+    column.key: column.type.length
+    for column in Goal.__table__.c if getattr(column.type, "length", None)
+}
+
+
+def iter_records(stream: TextIO, import_format: str) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """Yield (row_number, record, error) for every data row, reading one row at a time.
+
+    Row numbers start at 1: the first row after the CSV header, or the
+    first line of a JSONL file. Empty CSV cells become None.
+    """
+    if import_format == "csv":
+        for number, record in enumerate(csv.DictReader(stream), 1):
+            if None in record:
+                yield number, None, "Row has more fields than the header"
+                continue
+            yield number, {key: (value if value != "" else None) for key, value in record.items()}, None
+        return
+
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield number, None, "Each line must be a JSON object"
+            continue
+        yield number, record, None
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in error.errors()
+    )
+
+
+def import_goal_batch(db: Session, batch: List[Tuple[int, dict]]) -> Dict[str, Any]:
+    """Validate and insert one batch of (row_number, record) pairs in a single transaction.
+
+    Owner emails, reviewer ids and existing goals (same owner, title and
+    quarter) are each checked with one query, so rows already imported by an
+    earlier, interrupted run are skipped rather than duplicated. Column
+    lengths are checked too, leaving the INSERT nothing to reject per row.
+    """
+    errors, candidates = [], []
+    for number, record in batch:
+        record = dict(record)
+        email = record.pop(EMAIL_FIELD, None)
+        if not isinstance(email, str) or not email.strip():
+            errors.append({"row": number, "error": f"{EMAIL_FIELD} is required"})
+            continue
+        try:
+            goal = GoalCreate(**record)
+        except ValidationError as e:
+            errors.append({"row": number, "error": _validation_message(e)})
+            continue
+        too_long = [
+            f"{field}: at most {limit} characters"
+            for field, limit in _LENGTH_LIMITS.items()
+            if isinstance(getattr(goal, field, None), str) and len(getattr(goal, field)) > limit
+        ]
+        if too_long:
+            errors.append({"row": number, "error": "; ".join(too_long)})
+            continue
+        candidates.append((number, email.strip(), goal))
+
+    emails = {email for _, email, _ in candidates}
+    user_ids = dict(db.execute(select(User.email, User.id).where(User.email.in_(emails))).all()) if emails else {}
+    reviewer_ids = {goal.reviewer_id for _, _, goal in candidates if goal.reviewer_id is not None}
+    if reviewer_ids:
+        reviewer_ids = set(db.execute(select(User.id).where(User.id.in_(reviewer_ids))).scalars())
+
+    keys = {(user_ids[email], goal.title) for _, email, goal in candidates if email in user_ids}
+    existing = set()
+    if keys:
+        existing = set(db.execute(
+            select(Goal.user_id, Goal.title, Goal.quarter).where(tuple_(Goal.user_id, Goal.title).in_(keys))
+        ).all())
+
+    rows, skipped = [], 0
+    for number, email, goal in candidates:
+        user_id = user_ids.get(email)
+        if user_id is None:
+            errors.append({"row": number, "error": f"No user with email {email}"})
+            continue
+        if goal.reviewer_id is not None and goal.reviewer_id not in reviewer_ids:
+            errors.append({"row": number, "error": f"No reviewer with id {goal.reviewer_id}"})
+            continue
+        key = (user_id, goal.title, goal.quarter)
+        if key in existing:
+            skipped += 1
+            continue
+        existing.add(key)
+        rows.append(dict(
+            user_id=user_id,
+            title=goal.title,
+            description=goal.description,
+            target=goal.target,
+            quarter=goal.quarter,
+            start_date=goal.start_date,
+            end_date=goal.end_date,
+            status=GoalStatus.draft,
+            comments=goal.comments,
+            reviewer_id=goal.reviewer_id
+        ))
+
+    if rows:
+        BaseService(db, Goal).bulk_create(rows)
+    return {"imported": len(rows), "skipped": skipped, "errors": errors}
+
+
+def import_goals(db: Session, stream: TextIO, import_format: str, start_row: int = 0,
+                 batch_size: Optional[int] = None,
+                 on_batch: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Import goals from a CSV or JSONL stream in committed batches; returns a summary.
+
+    Rows up to start_row are skipped, so an interrupted import resumes by
+    passing the last_row of its previous summary (or on_batch callback).
+    on_batch gets the running summary after every committed batch.
+
+    The import stops early, rather than raising, if the stream is not valid
+    UTF-8 or a batch cannot be saved: the summary then carries an "error"
+    message and "error_type" ("decode" or "batch"), and last_row is the last
+    row of the last committed batch.
+    """
+    if import_format not in IMPORT_FORMATS:
+        raise ValueError(f"import format must be one of {', '.join(IMPORT_FORMATS)}")
+    batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+    summary = {"imported": 0, "skipped": 0, "failed": 0, "errors": [], "last_row": start_row}
+
+    def add_errors(errors):
+        summary["failed"] += len(errors)
+        room = MAX_REPORTED_ERRORS - len(summary["errors"])
+        summary["errors"].extend(errors[:max(room, 0)])
+
+    def flush(batch, parse_errors, last_row) -> bool:
+        try:
+            result = import_goal_batch(db, batch) if batch else {"imported": 0, "skipped": 0, "errors": []}
+        except Exception as e:
+            db.rollback()
+            summary["error"] = f"Rows {summary['last_row'] + 1}-{last_row} could not be saved: {e}"
+            summary["error_type"] = "batch"
+            return False
+        summary["imported"] += result["imported"]
+        summary["skipped"] += result["skipped"]
+        add_errors(sorted(parse_errors + result["errors"], key=itemgetter("row")))
+        summary["last_row"] = last_row
+        if on_batch is not None:
+            on_batch(summary)
+        return True
+
+    batch, pending_errors, last_row = [], [], start_row
+    try:
+        for number, record, error in iter_records(stream, import_format):
+            if number <= start_row:
+                continue
+            last_row = number
+            if error:
+                pending_errors.append({"row": number, "error": error})
+            else:
+                batch.append((number, record))
+            if len(batch) + len(pending_errors) >= batch_size:
+                if not flush(batch, pending_errors, last_row):
+                    return summary
+                batch, pending_errors = [], []
+    except UnicodeDecodeError:
+        # Keep the rows read before the undecodable bytes
+        if (batch or pending_errors) and not flush(batch, pending_errors, last_row):
+            return summary
+        summary["error"] = f"The file is not valid UTF-8 after row {summary['last_row']}; save it as UTF-8 and resume"
+        summary["error_type"] = "decode"
+        return summary
+
+    if batch or pending_errors:
+        flush(batch, pending_errors, last_row)
+    return summary
@@ -0,0 +1,29 @@
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.goal import Goal, GoalStatus
+from app.models.user import User, UserRole
+
+# The User columns GoalResponse.user serializes (everything but the password hash)
+GOAL_USER_COLUMNS = (
+    User.id, User.employee_id, User.name, User.email, User.role, User.department,
+    User.manager_id, User.appraiser_id, User.title, User.phone, User.profile_picture,
+    User.total_experience_years, User.company_experience_years, User.is_active,
+    User.approval_status, User.approved_by, User.approved_at, User.created_at, User.updated_at,
+)
+
+
+def with_goal_user(query):
+    """Load each goal's owner in the same statement, for responses that include GoalResponse.user.
+
+    Goal.user is many-to-one and never null, so an inner join adds no rows
+    and keeps LIMIT and keyset pagination correct.
+    """
+    return query.options(joinedload(Goal.user, innerjoin=True).load_only(*GOAL_USER_COLUMNS))
+
+
+def review_queue(db: Session, current_user: User):
+    """Submitted goals awaiting the user's review (every one for admins), with their owners"""
+    query = with_goal_user(db.query(Goal)).filter(Goal.status == GoalStatus.submitted)
+    if current_user.role != UserRole.ADMIN:
+        query = query.filter(Goal.reviewer_id == current_user.id)
+    return query.order_by(Goal.id).all()
@@ -2,8 +2,11 @@ from sqlalchemy.orm import Session
 from app.models.notification import Notification, NotificationType
 from app.models.user import User
 from app.models.goal import Goal
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import insert
 from datetime import datetime
+from app.utils.pagination import keyset_paginate, build_page
+from app.utils.writes import insert_returning
 
 class NotificationService:
     def __init__(self, db: Session):
@@ -29,24 +32,33 @@ class NotificationService:
             sender_id=sender_id,
             related_user_id=related_user_id
         )
-        self.db.add(notification)
+        insert_returning(self.db, notification)
         self.db.commit()
-        self.db.refresh(notification)
         return notification
     
+    def create_notifications(self, rows: Sequence[Dict]) -> int:
+        """Insert many notifications with one multi-row INSERT; the caller commits."""
+        if not rows:
+            return 0
+        self.db.execute(insert(Notification.__table__).values(list(rows)))
+        return len(rows)
+    
     def get_user_notifications(
         self,
         user_id: int,
         unread_only: bool = False,
-        limit: int = 50
-    ) -> List[Notification]:
-        """Get notifications for a user."""
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Notification], Optional[str]]:
+        """Get a page of notifications for a user, newest first, and the next-page cursor."""
         query = self.db.query(Notification).filter(Notification.user_id == user_id)
         
         if unread_only:
             query = query.filter(Notification.is_read == False)
         
-        return query.order_by(Notification.created_at.desc()).limit(limit).all()
+        columns = [Notification.created_at, Notification.id]
+        rows = keyset_paginate(query, columns, cursor, limit, descending=True).all()
+        return build_page(rows, columns, limit)
     
     def mark_notification_read(self, notification_id: int, user_id: int) -> Optional[Notification]:
         """Mark a notification as read."""
@@ -58,7 +70,6 @@ class NotificationService:
         if notification:
             notification.is_read = True
             self.db.commit()
-            self.db.refresh(notification)
         
         return notification
     
@@ -96,6 +107,40 @@ class NotificationService:
             sender_id=employee.id
         )
     
+    def notify_goals_submitted(
+        self,
+        goals: Sequence[Tuple[int, str]],
+        reviewer_id: int,
+        employee: User,
+        collapse: bool = False
+    ) -> int:
+        """Notify a reviewer of many submitted (goal_id, title) goals in one INSERT, without committing.
+        
+        With collapse, several goals become a single "N goals submitted" notification.
+        """
+        if collapse and len(goals) > 1:
+            rows = [dict(
+                user_id=reviewer_id,
+                title="New Goals Submitted for Review",
+                message=f"{employee.name} has submitted {len(goals)} goals for your review.",
+                notification_type=NotificationType.GOAL_SUBMITTED,
+                goal_id=None,
+                sender_id=employee.id
+            )]
+        else:
+            rows = [
+                dict(
+                    user_id=reviewer_id,
+                    title="New Goal Submitted for Review",
+                    message=f"{employee.name} has submitted goal '{title}' for your review.",
+                    notification_type=NotificationType.GOAL_SUBMITTED,
+                    goal_id=goal_id,
+                    sender_id=employee.id
+                )
+                for goal_id, title in goals
+            ]
+        return self.create_notifications(rows)
+    
     def notify_goal_reviewed(self, goal: Goal, reviewer: User, action: str) -> Notification:
         """Create notification when a goal is reviewed."""
         title_map = {
@@ -0,0 +1,27 @@
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from app.models.user import User
+
+
+def subordinates_cte(manager_id: int, name: str = "subordinates"):
+    """Recursive CTE holding the id of every user below a manager, at any depth.
+
+    Each step follows manager_id one level down through ix_users_manager_id_role,
+    so the whole subtree comes back from a single statement. UNION (rather than
+    UNION ALL) drops ids already seen, which also stops the recursion if the
+    manager chain ever contains a cycle.
+    """
+    tree = (
+        select(User.id.label("user_id"))
+        .where(User.manager_id == manager_id)
+        .cte(name, recursive=True)
+    )
+    report = aliased(User)
+    return tree.union(select(report.id).where(report.manager_id == tree.c.user_id))
+
+
+def subordinate_ids(manager_id: int):
+    """Select of every user id below a manager, for use with in_() or as a join target"""
+    tree = subordinates_cte(manager_id)
+    return select(tree.c.user_id)
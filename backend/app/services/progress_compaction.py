@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import attrgetter
+from typing import Callable, List, Optional, Sequence, Set
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.goal import GoalProgressHistory
+from app.utils.time_buckets import BUCKETS, bucket_start
+
+
+def downsample(points: Sequence, bucket: str, keep: Callable = lambda point: False) -> List:
+    """Keep the last point of every bucket, plus the first point and any point keep() accepts.
+
+    Points must be ordered oldest first and have a created_at attribute.
+    The last point of a bucket is the value the goal ended that period
+    with, so a downsampled series still ends on the latest value.
+    """
+    kept = []
+    for index, point in enumerate(points):
+        last_in_bucket = (
+            index == len(points) - 1 or
+            bucket_start(points[index + 1].created_at, bucket) != bucket_start(point.created_at, bucket)
+        )
+        if index == 0 or last_in_bucket or keep(point):
+            kept.append(point)
+    return kept
+
+
+def limit_points(points: Sequence, max_points: int) -> List:
+    """Evenly spaced subset of at most max_points points, always including the first and last"""
+    if len(points) <= max_points:
+        return list(points)
+    if max_points == 1:
+        return [points[-1]]
+    step = (len(points) - 1) / (max_points - 1)
+    return [points[round(index * step)] for index in range(max_points)]
+
+
+def fit_points(points: Sequence, max_points: int, keep: Callable = lambda point: False) -> List:
+    """Downsample to the finest bucket that fits max_points, thinning evenly if none does.
+
+    Points keep() accepts always stay and do not count towards max_points,
+    so a series with many of them can come back longer than max_points.
+    """
+    for bucket in BUCKETS:
+        if sum(1 for point in points if not keep(point)) <= max_points:
+            break
+        points = downsample(points, bucket, keep)
+    chosen = {id(point) for point in limit_points([point for point in points if not keep(point)], max_points)}
+    return [point for point in points if keep(point) or id(point) in chosen]
+
+
+def has_comments(point) -> bool:
+    return bool(point.comments and point.comments.strip())
+
+
+def compaction_victims(points: Sequence, now: datetime) -> Set[int]:
+    """Ids of one goal's history rows that compaction removes.
+
+    Rows newer than PROGRESS_HISTORY_FULL_DAYS keep full resolution, older
+    rows keep one point per day, and rows older than PROGRESS_HISTORY_DAILY_DAYS
+    one point per ISO week. The first row and rows with comments always stay;
+    the newest row always stays because it is the last of its bucket.
+    """
+    full_cutoff = now - timedelta(days=settings.PROGRESS_HISTORY_FULL_DAYS)
+    daily_cutoff = now - timedelta(days=settings.PROGRESS_HISTORY_DAILY_DAYS)
+    weekly = [point for point in points if point.created_at < daily_cutoff]
+    daily = [point for point in points if daily_cutoff <= point.created_at < full_cutoff]
+
+    kept = {point.id for point in downsample(weekly, "week", has_comments)}
+    kept.update(point.id for point in downsample(daily, "day", has_comments))
+    if points:
+        kept.add(points[0].id)
+    return {point.id for point in weekly + daily} - kept
+
+
+def compact_progress_history(db: Session, now: Optional[datetime] = None,
+                             goal_batch_size: int = 200, delete_chunk_size: int = 500) -> int:
+    """Downsample old progress history for every goal; returns rows deleted.
+
+    Goals are processed in batches, each in its own transaction, reading
+    only rows past the full-resolution window through the (goal_id,
+    created_at) index. The daily rollup is left alone, so progress trends
+    still count every update that was made; from then on rebuild_rollup
+    must only rebuild days from compaction_safe_since(). Safe to re-run.
+    """
+    now = now or datetime.utcnow()
+    full_cutoff = now - timedelta(days=settings.PROGRESS_HISTORY_FULL_DAYS)
+    goal_ids = db.execute(
+        select(GoalProgressHistory.goal_id)
+        .where(GoalProgressHistory.created_at < full_cutoff)
+        .distinct()
+        .order_by(GoalProgressHistory.goal_id)
+    ).scalars().all()
+
+    deleted = 0
+    for start in range(0, len(goal_ids), goal_batch_size):
+        batch = goal_ids[start:start + goal_batch_size]
+        rows = db.execute(
+            select(
+                GoalProgressHistory.id, GoalProgressHistory.goal_id,
+                GoalProgressHistory.created_at, GoalProgressHistory.comments
+            )
+            .where(GoalProgressHistory.goal_id.in_(batch), GoalProgressHistory.created_at < full_cutoff)
+            .order_by(GoalProgressHistory.goal_id, GoalProgressHistory.created_at, GoalProgressHistory.id)
+        ).all()
+        # The first row of the goal's whole history is always older than the cutoff, so it is in rows
+        victims = []
+        for _, points in groupby(rows, key=attrgetter("goal_id")):
+            victims.extend(compaction_victims(list(points), now))
+        try:
+            for chunk in range(0, len(victims), delete_chunk_size):
+                db.execute(delete(GoalProgressHistory).where(
+                    GoalProgressHistory.id.in_(victims[chunk:chunk + delete_chunk_size])
+                ))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        deleted += len(victims)
+    return deleted
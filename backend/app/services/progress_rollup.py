@@ -0,0 +1,118 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.goal import GoalProgressHistory, GoalProgressDaily
+from app.utils.time_buckets import time_bucket
+
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def record_progress(db: Session, user_id: int, progress: Decimal, day: date):
+    """Add one progress update to the user's rollup row for that day.
+
+    Runs in the caller's transaction, so the rollup commits or rolls back
+    together with the history row it summarizes.
+    """
+    table = GoalProgressDaily.__table__
+    dialect_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        statement = dialect_insert(table).values(
+            user_id=user_id, day=day, progress_sum=progress, update_count=1
+        )
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.day],
+            set_={
+                "progress_sum": table.c.progress_sum + statement.excluded.progress_sum,
+                "update_count": table.c.update_count + statement.excluded.update_count,
+            }
+        ))
+        return
+
+    result = db.execute(
+        update(table)
+        .where(table.c.user_id == user_id, table.c.day == day)
+        .values(progress_sum=table.c.progress_sum + progress, update_count=table.c.update_count + 1)
+    )
+    if result.rowcount == 0:
+        db.execute(insert(table).values(user_id=user_id, day=day, progress_sum=progress, update_count=1))
+
+
+def replace_progress(db: Session, user_id: int, old_progress: Decimal, old_day: date,
+                     progress: Decimal, day: date):
+    """Swap an already recorded update for a new value, moving it to another day if needed.
+
+    Used when a progress update is coalesced into the previous one: the
+    update count stays the same and only the sum changes.
+    """
+    table = GoalProgressDaily.__table__
+    if old_day == day:
+        db.execute(
+            update(table)
+            .where(table.c.user_id == user_id, table.c.day == day)
+            .values(progress_sum=table.c.progress_sum + (progress - old_progress))
+        )
+        return
+    db.execute(
+        update(table)
+        .where(table.c.user_id == user_id, table.c.day == old_day)
+        .values(progress_sum=table.c.progress_sum - old_progress, update_count=table.c.update_count - 1)
+    )
+    record_progress(db, user_id, progress, day)
+
+
+def compaction_safe_since(today: Optional[date] = None) -> date:
+    """First day whose history compaction never touches, so it can always be rebuilt exactly.
+
+    compact_progress_history only deletes rows older than
+    PROGRESS_HISTORY_FULL_DAYS, so every whole day after that cutoff still
+    has all of its history rows (as long as that setting has never been
+    lowered). The cutoff's own day may have lost its earlier rows.
+    """
+    today = today or datetime.utcnow().date()
+    return today - timedelta(days=settings.PROGRESS_HISTORY_FULL_DAYS - 1)
+
+
+def rebuild_rollup(db: Session, since: Optional[date] = None) -> int:
+    """Recompute the rollup from progress history in one transaction; returns rows written.
+
+    With since, only days from that date on are replaced. Pass
+    compaction_safe_since() once progress history has been compacted:
+    compaction deletes old history rows while the rollup keeps counting
+    every update, so rebuilding older days would quietly rewrite past
+    trends from the surviving rows only. Rebuild everything (since=None)
+    only if compaction has never run.
+    """
+    table = GoalProgressDaily.__table__
+    day = time_bucket("day", GoalProgressHistory.created_at)
+    summary = (
+        select(
+            GoalProgressHistory.user_id,
+            day,
+            func.sum(GoalProgressHistory.progress),
+            func.count(GoalProgressHistory.id)
+        )
+        .group_by(GoalProgressHistory.user_id, day)
+    )
+    clear = delete(table)
+    written = select(func.count()).select_from(table)
+    if since is not None:
+        summary = summary.where(GoalProgressHistory.created_at >= datetime.combine(since, time.min))
+        clear = clear.where(table.c.day >= since)
+        written = written.where(table.c.day >= since)
+    try:
+        db.execute(clear)
+        db.execute(insert(table).from_select(
+            ["user_id", "day", "progress_sum", "update_count"], summary
+        ))
+        count = db.execute(written).scalar()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return count
@@ -0,0 +1,179 @@
+from datetime import date, datetime
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import func, select, union_all, cast, literal_column, String, Float
+
+from app.models.user import User, UserRole
+from app.models.goal import Goal, GoalStatus, GoalProgressDaily
+from app.models.review import Review, ReviewType
+from app.models.skill import Skill, SkillCategory
+from app.services.org_tree import subordinate_ids
+from app.utils.time_buckets import BUCKETS, bucket_range, in_range, time_bucket
+
+# Bucket sizes the progress trend report can be grouped by
+TREND_GRANULARITIES = BUCKETS
+
+# Overview panels whose keys are enum names, and the enum to map them back to
+_OVERVIEW_ENUM_PANELS = {
+    "users_by_role": UserRole,
+    "goals_by_status": GoalStatus,
+    "skills_by_category": SkillCategory,
+}
+
+
+def _overview_panel(name: str, key=None):
+    """Leading columns of one overview panel: its name as a constant and its key as text"""
+    return [
+        literal_column(f"'{name}'").label("panel"),
+        cast(key, String).label("key"),
+    ]
+
+
+def admin_overview_statement(since: datetime):
+    """Every admin overview panel as one UNION ALL of (panel, key, value) rows"""
+    return union_all(
+        select(*_overview_panel("users_by_role", User.role), cast(func.count(User.id), Float).label("value"))
+        .group_by(User.role),
+        select(*_overview_panel("goals_by_status", Goal.status), cast(func.count(Goal.id), Float))
+        .group_by(Goal.status),
+        select(*_overview_panel("average_goal_progress"), cast(func.avg(Goal.progress), Float)),
+        select(*_overview_panel("recent_registrations"), cast(func.count(User.id), Float))
+        .where(User.created_at >= since),
+        select(*_overview_panel("skills_by_category", Skill.category), cast(func.count(Skill.id), Float))
+        .group_by(Skill.category),
+        select(*_overview_panel("reviews_by_rating", Review.rating), cast(func.count(Review.id), Float))
+        .group_by(Review.rating),
+    )
+
+
+def admin_overview_row(panel: str, key, value) -> Tuple[str, Any, Any]:
+    """Type one (panel, key, value) row: enum keys back to their enum, counts to ints"""
+    if panel == "average_goal_progress":
+        return panel, None, float(value or 0)
+    if panel == "recent_registrations":
+        return panel, None, int(value or 0)
+    if key is not None:
+        key = _OVERVIEW_ENUM_PANELS[panel][key] if panel in _OVERVIEW_ENUM_PANELS else int(key)
+    return panel, key, int(value)
+
+
+def admin_overview_from_rows(rows) -> Dict[str, Any]:
+    """Shape the (panel, key, value) rows into the overview response"""
+    panels = {"users_by_role": [], "goals_by_status": [], "skills_by_category": [], "reviews_by_rating": []}
+    scalars = {"average_goal_progress": 0.0, "recent_registrations": 0}
+    for panel, key, value in (admin_overview_row(*row) for row in rows):
+        if panel in scalars:
+            scalars[panel] = value
+        else:
+            panels[panel].append((key, value))
+    panels["reviews_by_rating"].sort(key=lambda item: (item[0] is None, item[0]))
+    
+    return {
+        "users_by_role": [{"role": role, "count": count} for role, count in panels["users_by_role"]],
+        "goals_by_status": [{"status": status, "count": count} for status, count in panels["goals_by_status"]],
+        "average_goal_progress": scalars["average_goal_progress"],
+        "recent_registrations": scalars["recent_registrations"],
+        "skills_by_category": [{"category": category, "count": count} for category, count in panels["skills_by_category"]],
+        "reviews_by_rating": [{"rating": rating, "count": count} for rating, count in panels["reviews_by_rating"]]
+    }
+
+
+def team_members_statement(manager_id: int):
+    """Per-member goal, skill and manager-rating aggregates for a manager's whole subtree in one query.
+
+    Each aggregate is grouped once over the whole team and left-joined to the
+    member rows, so the query count does not grow with the team size or depth.
+    """
+    team = subordinate_ids(manager_id)
+    goal_stats = (
+        select(
+            Goal.user_id,
+            func.count(Goal.id).label("goal_count"),
+            func.avg(Goal.progress).label("average_progress")
+        )
+        .where(Goal.user_id.in_(team))
+        .group_by(Goal.user_id)
+        .subquery()
+    )
+    skill_stats = (
+        select(Skill.user_id, func.count(Skill.id).label("skill_count"))
+        .where(Skill.user_id.in_(team))
+        .group_by(Skill.user_id)
+        .subquery()
+    )
+    rating_stats = (
+        select(Goal.user_id, func.avg(Review.rating).label("average_rating"))
+        .join(Goal, Goal.id == Review.goal_id)
+        .where(
+            Review.reviewer_id == manager_id,
+            Review.review_type == ReviewType.manager_review,
+            Goal.user_id.in_(team)
+        )
+        .group_by(Goal.user_id)
+        .subquery()
+    )
+    return (
+        select(
+            User.id,
+            User.name,
+            User.email,
+            User.department,
+            User.manager_id,
+            func.coalesce(goal_stats.c.goal_count, 0).label("goal_count"),
+            func.coalesce(goal_stats.c.average_progress, 0).label("average_progress"),
+            func.coalesce(skill_stats.c.skill_count, 0).label("skill_count"),
+            func.coalesce(rating_stats.c.average_rating, 0).label("average_rating")
+        )
+        .outerjoin(goal_stats, goal_stats.c.user_id == User.id)
+        .outerjoin(skill_stats, skill_stats.c.user_id == User.id)
+        .outerjoin(rating_stats, rating_stats.c.user_id == User.id)
+        .where(User.id.in_(team))
+        .order_by(User.id)
+    )
+
+
+def team_member_from_row(row) -> Dict[str, Any]:
+    """Shape one team_members_statement row into the response entry"""
+    return {
+        "id": row.id,
+        "name": row.name,
+        "email": row.email,
+        "department": row.department,
+        "manager_id": row.manager_id,
+        "goal_count": row.goal_count,
+        "average_progress": float(row.average_progress),
+        "skill_count": row.skill_count,
+        "average_rating": float(row.average_rating)
+    }
+
+
+def progress_trend_statement(since: date, until: date, granularity: str = "day", team=None):
+    """Average progress per bucket from the rollup, optionally limited to a team subquery.
+
+    The window is widened to whole buckets and filtered on the bare day
+    column, so ix_goal_progress_daily_day (or the user_id, day index for a
+    team) serves it; only the grouping goes through time_bucket().
+    """
+    lo, hi = bucket_range(since, until, granularity)
+    bucket = time_bucket(granularity, GoalProgressDaily.day).label("bucket")
+    statement = (
+        select(
+            bucket,
+            func.sum(GoalProgressDaily.progress_sum).label("progress_sum"),
+            func.sum(GoalProgressDaily.update_count).label("update_count")
+        )
+        .where(in_range(GoalProgressDaily.day, lo, hi))
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+    if team is not None:
+        statement = statement.where(GoalProgressDaily.user_id.in_(team))
+    return statement
+
+
+def progress_trend_from_rows(rows) -> List[Dict[str, Any]]:
+    """Trend points from (bucket, progress_sum, update_count) rows"""
+    return [
+        {"date": str(bucket), "avg_progress": float(progress_sum or 0) / update_count}
+        for bucket, progress_sum, update_count in rows if update_count
+    ]
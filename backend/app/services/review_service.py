@@ -0,0 +1,128 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import case, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.user import User, UserRole
+from app.models.goal import Goal
+from app.models.review import Review, ReviewType
+from app.services.org_tree import subordinate_ids
+from app.services.base_service import BaseService
+
+
+def _rating_of(review_type: ReviewType, column):
+    """Pick a column from the review of one type within a (goal, quarter) group"""
+    return func.max(case((Review.review_type == review_type, column)))
+
+
+def review_comparison_statement(quarter: str, goal_ids: Optional[Sequence[int]] = None, team=None):
+    """Self-assessment vs manager review for every goal in scope, one row per goal.
+
+    Both reviews are pivoted onto the goal's row with conditional aggregates,
+    and rating_difference (manager - self) is computed in the query; it is
+    NULL unless both reviews exist. Rows are keyed and ordered by goal_id for
+    keyset pagination. team is a select of user ids, usually subordinate_ids().
+    """
+    self_rating = _rating_of(ReviewType.self_assessment, Review.rating)
+    manager_rating = _rating_of(ReviewType.manager_review, Review.rating)
+    statement = (
+        select(
+            Review.goal_id,
+            Goal.title.label("goal_title"),
+            Goal.user_id,
+            Review.quarter,
+            _rating_of(ReviewType.self_assessment, Review.id).label("self_assessment_id"),
+            self_rating.label("self_rating"),
+            _rating_of(ReviewType.manager_review, Review.id).label("manager_review_id"),
+            manager_rating.label("manager_rating"),
+            (manager_rating - self_rating).label("rating_difference"),
+        )
+        .join(Goal, Goal.id == Review.goal_id)
+        .where(Review.quarter == quarter)
+        .group_by(Review.goal_id, Goal.title, Goal.user_id, Review.quarter)
+    )
+    if goal_ids is not None:
+        statement = statement.where(Review.goal_id.in_(goal_ids))
+    if team is not None:
+        statement = statement.where(Goal.user_id.in_(team))
+    return statement
+
+
+def restrict_to_visible_goals(statement, current_user: User, team=None):
+    """Limit a statement joined to goals to those the user may compare reviews for.
+
+    Pass the user's subordinate_ids() select as team when the statement
+    already uses it: every subtree select is a CTE named "subordinates", and
+    a statement cannot hold two different CTEs with one name.
+    """
+    if current_user.role == UserRole.EMPLOYEE:
+        return statement.where(Goal.user_id == current_user.id)
+    if current_user.role == UserRole.REVIEWER:
+        return statement.where(
+            (Goal.reviewer_id == current_user.id) |
+            Goal.user_id.in_(team if team is not None else subordinate_ids(current_user.id))
+        )
+    return statement
+
+
+def visible_review_comparisons(quarter: str, current_user: User,
+                               goal_ids: Optional[Sequence[int]] = None, team: bool = False):
+    """review_comparison_statement for the goals the user may see, optionally their whole subtree"""
+    # One subtree select serves both the team filter and the visibility check
+    team_ids = subordinate_ids(current_user.id) if team else None
+    statement = review_comparison_statement(quarter, goal_ids=goal_ids, team=team_ids)
+    return restrict_to_visible_goals(statement, current_user, team=team_ids)
+
+
+def create_manager_reviews(db: Session, reviews: Sequence[Any], current_user: User) -> List[Dict[str, Any]]:
+    """Validate and insert many manager reviews; returns one result dict per item, in order.
+
+    Goal access and duplicates are checked for the whole batch with one query
+    each, duplicates within the batch included. Every valid review is then
+    inserted in a single transaction; invalid items get an error instead.
+    """
+    goal_ids = {review.goal_id for review in reviews}
+    existing = set(db.execute(select(Goal.id).where(Goal.id.in_(goal_ids))).scalars())
+    visible = set(db.execute(
+        restrict_to_visible_goals(select(Goal.id).where(Goal.id.in_(existing)), current_user)
+    ).scalars())
+
+    pairs = {(review.goal_id, review.quarter) for review in reviews}
+    taken = set(db.execute(
+        select(Review.goal_id, Review.quarter).where(
+            tuple_(Review.goal_id, Review.quarter).in_(pairs),
+            Review.review_type == ReviewType.manager_review
+        )
+    ).all())
+
+    results, rows = [], []
+    for index, review in enumerate(reviews):
+        result = {"index": index, "goal_id": review.goal_id, "quarter": review.quarter}
+        key = (review.goal_id, review.quarter)
+        if review.goal_id not in existing:
+            result["error"] = "Goal not found"
+        elif review.goal_id not in visible:
+            result["error"] = "Access denied"
+        elif key in taken:
+            result["error"] = "A manager_review already exists for this goal and quarter"
+        else:
+            taken.add(key)
+            rows.append(dict(
+                goal_id=review.goal_id,
+                reviewer_id=current_user.id,
+                review_type=ReviewType.manager_review,
+                quarter=review.quarter,
+                rating=review.rating,
+                comments=review.comments,
+                strengths=review.strengths,
+                areas_for_improvement=review.areas_for_improvement
+            ))
+        results.append(result)
+
+    if rows:
+        # (goal_id, quarter) is unique within rows, so RETURNING ids are matched to rows by it
+        ids = iter(BaseService(db, Review).bulk_create(rows, return_ids=True, key=("goal_id", "quarter")))
+        for result in results:
+            if "error" not in result:
+                result["review_id"] = next(ids)
+    return results
@@ -0,0 +1,156 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class MemoryRepository:
+    """In-memory record store with a primary-key map and secondary indexes.
+
+    Records are plain dicts. Every indexed field maps value -> {pk: record},
+    so lookups by primary key or by an indexed field never scan the store.
+    Records must be changed through ``update`` so the indexes stay in sync.
+    """
+
+    def __init__(self, records: Iterable[dict] = (), key: str = "id",
+                 indexes: Tuple[str, ...] = (), unique: Tuple[str, ...] = ()):
+        self.key = key
+        self._records: Dict[Any, dict] = {}
+        self._indexes: Dict[str, Dict[Any, Dict[Any, dict]]] = {
+            field: defaultdict(dict) for field in indexes
+        }
+        self._unique: Dict[str, Dict[Any, dict]] = {field: {} for field in unique}
+        # Largest integer primary key ever added, so next_id never scans
+        self._max_id = 0
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(list(self._records.values()))
+
+    def __contains__(self, pk) -> bool:
+        return pk in self._records
+
+    def all(self) -> List[dict]:
+        """Return every record in insertion order"""
+        return list(self._records.values())
+
+    def get(self, pk) -> Optional[dict]:
+        """Get a record by primary key"""
+        return self._records.get(pk)
+
+    def get_by(self, field: str, value) -> Optional[dict]:
+        """Get a record by a unique field"""
+        return self._unique[field].get(value)
+
+    def find(self, **criteria) -> List[dict]:
+        """Return records matching every criterion.
+
+        Indexed criteria are resolved through their index, starting from the
+        smallest candidate set; any remaining criteria filter that set.
+        """
+        indexed = [field for field in criteria if field in self._indexes]
+        remaining = dict(criteria)
+        if not indexed:
+            candidates = self._records.values()
+        else:
+            field = min(indexed, key=lambda f: len(self._indexes[f].get(criteria[f], {})))
+            candidates = self._indexes[field].get(remaining.pop(field), {}).values()
+        if not remaining:
+            return list(candidates)
+        return [
+            record for record in candidates
+            if all(record.get(field) == value for field, value in remaining.items())
+        ]
+
+    def count(self, **criteria) -> int:
+        """Count records matching every criterion"""
+        if len(criteria) == 1:
+            (field, value), = criteria.items()
+            if field in self._indexes:
+                return len(self._indexes[field].get(value, {}))
+        return len(self.find(**criteria)) if criteria else len(self._records)
+
+    def group_counts(self, field: str) -> Dict[Any, int]:
+        """Return {value: count} for an indexed field"""
+        return {value: len(bucket) for value, bucket in self._indexes[field].items() if bucket}
+
+    def next_id(self) -> int:
+        """Return the next free integer primary key"""
+        return self._max_id + 1
+
+    def add(self, record: dict) -> dict:
+        """Insert a record and index it"""
+        pk = record[self.key]
+        if pk in self._records:
+            raise KeyError(f"Duplicate {self.key}: {pk}")
+        self._check_unique(record)
+        self._records[pk] = record
+        self._track_id(pk)
+        self._index(record)
+        return record
+
+    def update(self, pk, changes: dict) -> Optional[dict]:
+        """Apply changes to a record, re-indexing any indexed fields.
+
+        Raises KeyError, leaving the record unchanged, if the changes would
+        duplicate another record's primary key or unique field.
+        """
+        record = self._records.get(pk)
+        if record is None:
+            return None
+        new_pk = changes.get(self.key, pk)
+        if new_pk != pk and new_pk in self._records:
+            raise KeyError(f"Duplicate {self.key}: {new_pk}")
+        self._check_unique({**record, **changes}, record)
+        self._unindex(record)
+        record.update(changes)
+        if new_pk != pk:
+            del self._records[pk]
+            self._records[new_pk] = record
+            self._track_id(new_pk)
+        self._index(record)
+        return record
+
+    def remove(self, pk) -> Optional[dict]:
+        """Delete a record by primary key"""
+        record = self._records.pop(pk, None)
+        if record is not None:
+            self._unindex(record)
+        return record
+
+    def _check_unique(self, record: dict, current: Optional[dict] = None):
+        """Raise KeyError if a unique field of record belongs to a record other than current"""
+        for field, index in self._unique.items():
+            value = record.get(field)
+            holder = index.get(value) if value is not None else None
+            if holder is not None and holder is not current:
+                raise KeyError(f"Duplicate {field}: {value}")
+
+    def _track_id(self, pk):
+        if isinstance(pk, int) and pk > self._max_id:
+            self._max_id = pk
+
+    def _index(self, record: dict):
+        pk = record[self.key]
+        for field, index in self._indexes.items():
+            index[record.get(field)][pk] = record
+        for field, index in self._unique.items():
+            value = record.get(field)
+            if value is not None:
+                index[value] = record
+
+    def _unindex(self, record: dict):
+        pk = record[self.key]
+        for field, index in self._indexes.items():
+            value = record.get(field)
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(pk, None)
+                if not bucket:
+                    del index[value]
+        for field, index in self._unique.items():
+            value = record.get(field)
+            if value is not None and index.get(value) is record:
+                del index[value]
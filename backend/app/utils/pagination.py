@@ -0,0 +1,67 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_, Date, DateTime
+
+from app.utils.exceptions import raise_bad_request
+
+# Response header carrying the cursor for list endpoints that return a bare list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of the last row on a page as an opaque cursor"""
+    payload = [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> List[Any]:
+    """Decode a cursor back into values typed like the given sort columns"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(columns):
+            raise ValueError("cursor does not match sort key")
+        values = []
+        for column, value in zip(columns, payload):
+            if value is not None and isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif value is not None and isinstance(column.type, Date):
+                value = date.fromisoformat(value)
+            values.append(value)
+        return values
+    except (ValueError, TypeError):
+        raise raise_bad_request("Invalid pagination cursor")
+
+
+def keyset_paginate(query, columns: Sequence, cursor: Optional[str] = None,
+                    limit: Optional[int] = 50, descending: bool = False):
+    """Apply keyset pagination to a Query or Select.
+
+    Rows are ordered by ``columns`` (which must end in a unique column such
+    as the primary key) and only rows after the cursor are selected, so every
+    page is an index range scan no matter how deep it is. One extra row is
+    fetched to tell whether a next page exists; pass the results to
+    ``build_page``. A limit of None selects every remaining row, for list
+    endpoints whose callers predate pagination.
+    """
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        key = tuple_(*columns) if len(columns) > 1 else columns[0]
+        bound = tuple_(*values) if len(columns) > 1 else values[0]
+        query = query.filter(key < bound if descending else key > bound)
+    ordering = [column.desc() if descending else column.asc() for column in columns]
+    query = query.order_by(*ordering)
+    return query.limit(limit + 1) if limit is not None else query
+
+
+def build_page(rows: Sequence, columns: Sequence, limit: Optional[int]) -> Tuple[list, Optional[str]]:
+    """Trim the look-ahead row and return (items, next_cursor)"""
+    items = list(rows[:limit])
+    if limit is None or len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor([getattr(last, column.key) for column in columns])
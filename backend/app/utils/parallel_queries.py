@@ -0,0 +1,26 @@
+import asyncio
+from typing import Any, Dict, List
+
+from app.config.settings import settings
+from app.database import get_async_sessionmaker
+
+
+async def gather_rows(statements: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Run independent read-only statements concurrently and return {name: rows}.
+
+    Each statement gets its own session, and so its own pooled connection, so
+    the wait is that of the slowest statement rather than the sum of all of
+    them. At most PARALLEL_QUERY_LIMIT run at once to leave the pool room for
+    other requests. The statements do not share a transaction, so use this
+    only for reads that need not see one consistent snapshot.
+    """
+    session_factory = get_async_sessionmaker()
+    limit = asyncio.Semaphore(settings.PARALLEL_QUERY_LIMIT)
+
+    async def run(statement) -> List[Any]:
+        async with limit:
+            async with session_factory() as db:
+                return (await db.execute(statement)).all()
+
+    results = await asyncio.gather(*(run(statement) for statement in statements.values()))
+    return dict(zip(statements, results))
@@ -0,0 +1,139 @@
+import logging
+import re
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+# Stats of the most recent requests, newest last, for the debug endpoint
+RECENT_REQUESTS = deque(maxlen=settings.SQL_STATS_HISTORY)
+
+_PARAM = r"(?:\?|%\(\w+\)s|%s|\$\d+|:\w+)"
+_PARAM_LIST = re.compile(r"\(\s*" + _PARAM + r"(?:\s*,\s*" + _PARAM + r")+\s*\)")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize SQL so statements differing only in values or IN-list length compare equal"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _STRING_LITERAL.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    return _PARAM_LIST.sub("(?...)", shape)
+
+
+class QueryStats:
+    """Queries issued while handling one request"""
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.query_count = 0
+        self.total_time = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, duration: float):
+        self.query_count += 1
+        self.total_time += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int):
+        """Return (shape, count) pairs that ran more than threshold times"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    def to_dict(self) -> dict:
+        return {
+            "request": self.label,
+            "query_count": self.query_count,
+            "db_time_ms": round(self.total_time * 1000, 2),
+            "repeated_statements": [
+                {"statement": shape, "count": count}
+                for shape, count in self.shapes.most_common() if count > 1
+            ]
+        }
+
+
+def start_request(label: str = ""):
+    """Begin collecting stats for the current request; returns a token for finish_request"""
+    return _current_stats.set(QueryStats(label))
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def finish_request(token) -> Optional[QueryStats]:
+    """Stop collecting, warn about N+1 patterns and keep the stats for the debug endpoint"""
+    stats = _current_stats.get()
+    _current_stats.reset(token)
+    if stats is None:
+        return None
+    for shape, count in stats.repeated_shapes(settings.SQL_REPEAT_WARN_THRESHOLD):
+        logger.warning(
+            "Possible N+1 in %s: statement ran %d times: %s", stats.label, count, shape
+        )
+    RECENT_REQUESTS.append(stats.to_dict())
+    return stats
+
+
+def response_headers(stats: QueryStats) -> dict:
+    return {
+        "X-DB-Query-Count": str(stats.query_count),
+        "X-DB-Time-Ms": f"{stats.total_time * 1000:.2f}",
+    }
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context, so a statement that fails leaves nothing behind on the pooled connection
+    context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = context._query_start_time
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - start)
+
+
+def install_query_stats(engine):
+    """Attach the per-request counters to a (sync) engine"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware that adds the query headers to responses of the async routers"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_request(f"{scope['method']} {scope['path']}")
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                stats = current_stats()
+                if stats is not None:
+                    headers = list(message.get("headers", []))
+                    for name, value in response_headers(stats).items():
+                        headers.append((name.lower().encode(), value.encode()))
+                    message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            finish_request(token)
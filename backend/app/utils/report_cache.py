@@ -0,0 +1,177 @@
+import functools
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from sqlalchemy import event
+
+from app.config.settings import settings
+
+# Session.info key holding the tables written in the current transaction
+_TOUCHED_TABLES = "report_cache_touched_tables"
+
+
+class ReportCache:
+    """TTL cache for report responses, invalidated by the tables they read.
+
+    Every entry records the tables its report was computed from; committing a
+    write to any of those tables drops the entry. Invalidation only reaches
+    this process's cache, though, so a report cached by another worker can be
+    stale for up to the TTL (REPORT_CACHE_TTL_SECONDS) after a write.
+
+    Each invalidation bumps a generation counter. Callers read generation()
+    before computing a report and pass it to set(), which refuses the value
+    if any of its tables was invalidated meanwhile, so a report computed
+    before a concurrent commit is never cached after that commit.
+    """
+
+    def __init__(self, ttl_seconds: Optional[int] = None, clock=time.monotonic):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.REPORT_CACHE_TTL_SECONDS
+        self._clock = clock
+        self._entries: Dict[Tuple, Tuple[float, FrozenSet[str], Any]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        # Generation of the last invalidation of each table
+        self._invalidated_at: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return a live cached value, counting the hit or miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[2]
+
+    def generation(self) -> int:
+        """The current invalidation generation, to pass to set()"""
+        with self._lock:
+            return self._generation
+
+    def set(self, key: Tuple, value: Any, tables: Iterable[str], generation: Optional[int] = None) -> bool:
+        """Cache a value computed from the given tables; returns whether it was cached.
+
+        With a generation, the value is dropped if any of the tables was
+        invalidated after that generation was read.
+        """
+        tables = frozenset(tables)
+        expires_at = self._clock() + self.ttl_seconds
+        with self._lock:
+            if generation is not None and any(
+                self._invalidated_at.get(table, 0) > generation for table in tables
+            ):
+                return False
+            self._entries[key] = (expires_at, tables, value)
+            return True
+
+    def invalidate(self, tables: Iterable[str]) -> int:
+        """Drop every entry that read any of the given tables"""
+        tables = set(tables)
+        with self._lock:
+            self._generation += 1
+            for table in tables:
+                self._invalidated_at[table] = self._generation
+            stale = [key for key, (_, read, _) in self._entries.items() if read & tables]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+report_cache = ReportCache()
+
+
+def cached_report(*tables: str):
+    """Cache an async report endpoint's response.
+
+    The key combines the endpoint, the caller's role, the scoping user and the
+    remaining query parameters. Admin reports are global, so admins share
+    entries; every other role is scoped to its own user id. Only successful
+    responses are cached, since raised errors never reach the cache.
+    """
+    # Imported here: app.database installs the invalidation hooks before the models exist
+    from app.models.user import UserRole
+
+    def decorator(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            current_user = kwargs["current_user"]
+            scope = None if current_user.role == UserRole.ADMIN else current_user.id
+            params = tuple(sorted(
+                (name, value) for name, value in kwargs.items() if name not in ("current_user", "db")
+            ))
+            key = (endpoint.__name__, current_user.role, scope, params)
+            cached = report_cache.get(key)
+            if cached is not None:
+                return cached
+            # Read before computing, so a write committed while the report runs keeps it out of the cache
+            generation = report_cache.generation()
+            result = await endpoint(*args, **kwargs)
+            report_cache.set(key, result, tables, generation=generation)
+            return result
+        return wrapper
+    return decorator
+
+
+def _touched(session) -> set:
+    return session.info.setdefault(_TOUCHED_TABLES, set())
+
+
+def _after_flush(session, flush_context):
+    touched = _touched(session)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(instance, "__table__", None)
+        if table is not None:
+            touched.add(table.name)
+
+
+def _do_orm_execute(orm_execute_state):
+    # Core INSERT/UPDATE/DELETE run through Session.execute bypass the flush
+    statement = orm_execute_state.statement
+    table = getattr(statement, "table", None) if getattr(statement, "is_dml", False) else None
+    if table is not None:
+        _touched(orm_execute_state.session).add(table.name)
+
+
+def _after_commit(session):
+    touched = session.info.pop(_TOUCHED_TABLES, None)
+    if touched:
+        report_cache.invalidate(touched)
+
+
+def _after_rollback(session):
+    session.info.pop(_TOUCHED_TABLES, None)
+
+
+def install_report_cache_invalidation(session_class):
+    """Invalidate cached reports whenever a session commits writes to their tables"""
+    if not event.contains(session_class, "after_commit", _after_commit):
+        event.listen(session_class, "after_flush", _after_flush)
+        event.listen(session_class, "do_orm_execute", _do_orm_execute)
+        event.listen(session_class, "after_commit", _after_commit)
+        event.listen(session_class, "after_rollback", _after_rollback)
@@ -0,0 +1,97 @@
+import threading
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from app.config.settings import settings
+from app.utils.security import create_access_token
+
+
+class SessionStore:
+    """In-process table of opaque tokens.
+
+    Tokens map to (user_id, expires_at) so resolving a bearer token is a
+    single dict lookup. A second map from user id to that user's tokens
+    makes logout-everywhere and revocation on account removal cheap.
+
+    Sessions live in this process's memory only: a restart signs everyone
+    out, and with more than one worker a token is only known to the worker
+    that issued it, so the app must run as a single process.
+    """
+
+    # Sweep expired sessions once every this many logins
+    PURGE_INTERVAL = 256
+
+    def __init__(self, ttl_seconds: Optional[int] = None, clock=time.monotonic,
+                 token_factory: Callable[[dict], str] = create_access_token):
+        self.ttl_seconds = ttl_seconds or settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        self._clock = clock
+        self._token_factory = token_factory
+        self._sessions: Dict[str, Tuple[int, float]] = {}
+        self._by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._created_since_purge = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, user_id: int) -> str:
+        """Issue a new token for a user"""
+        token = self._token_factory({"user_id": user_id})
+        expires_at = self._clock() + self.ttl_seconds
+        with self._lock:
+            self._sessions[token] = (user_id, expires_at)
+            self._by_user.setdefault(user_id, set()).add(token)
+            self._created_since_purge += 1
+            if self._created_since_purge >= self.PURGE_INTERVAL:
+                self._purge_locked()
+        return token
+
+    def get_user_id(self, token: str) -> Optional[int]:
+        """Resolve a token to its user id, or None if unknown or expired"""
+        session = self._sessions.get(token)
+        if session is None:
+            return None
+        user_id, expires_at = session
+        if expires_at <= self._clock():
+            self.revoke(token)
+            return None
+        return user_id
+
+    def revoke(self, token: str) -> bool:
+        """Invalidate a single token"""
+        with self._lock:
+            session = self._sessions.pop(token, None)
+            if session is None:
+                return False
+            tokens = self._by_user.get(session[0])
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self._by_user[session[0]]
+            return True
+
+    def revoke_user(self, user_id: int) -> int:
+        """Invalidate every token issued to a user"""
+        with self._lock:
+            tokens = self._by_user.pop(user_id, set())
+            for token in tokens:
+                self._sessions.pop(token, None)
+            return len(tokens)
+
+    def purge_expired(self) -> int:
+        """Drop every expired session"""
+        with self._lock:
+            return self._purge_locked()
+
+    def _purge_locked(self) -> int:
+        now = self._clock()
+        expired = [token for token, (_, expires_at) in self._sessions.items() if expires_at <= now]
+        for token in expired:
+            user_id, _ = self._sessions.pop(token)
+            tokens = self._by_user.get(user_id)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self._by_user[user_id]
+        self._created_since_purge = 0
+        return len(expired)
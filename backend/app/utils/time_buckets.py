@@ -0,0 +1,98 @@
+from datetime import date, datetime, time, timedelta
+from typing import Tuple, Union
+
+from sqlalchemy import Date, and_, literal_column
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# Bucket sizes time-series endpoints can be grouped by; weeks start on Monday (ISO)
+BUCKETS = ("day", "week", "month", "quarter")
+
+# SQLite has no date_trunc; each bucket maps to date() modifiers or a printf
+_SQLITE_BUCKETS = {
+    "day": "date({column})",
+    "week": "date({column}, 'weekday 0', '-6 days')",
+    "month": "date({column}, 'start of month')",
+    "quarter": (
+        "printf('%04d-%02d-01', CAST(strftime('%Y', {column}) AS INTEGER), "
+        "(CAST(strftime('%m', {column}) AS INTEGER) - 1) / 3 * 3 + 1)"
+    ),
+}
+
+
+def _check_bucket(bucket: str):
+    if bucket not in BUCKETS:
+        raise ValueError(f"bucket must be one of {', '.join(BUCKETS)}")
+
+
+def bucket_start(value: Union[date, datetime], bucket: str) -> date:
+    """First day of the bucket a date (or datetime) falls in"""
+    _check_bucket(bucket)
+    day = value.date() if isinstance(value, datetime) else value
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    if bucket == "quarter":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    return day
+
+
+def next_bucket_start(value: Union[date, datetime], bucket: str) -> date:
+    """First day of the bucket after the one a date falls in"""
+    start = bucket_start(value, bucket)
+    if bucket == "day":
+        return start + timedelta(days=1)
+    if bucket == "week":
+        return start + timedelta(days=7)
+    months = 3 if bucket == "quarter" else 1
+    month = start.month - 1 + months
+    return start.replace(year=start.year + month // 12, month=month % 12 + 1)
+
+
+def bucket_range(start: Union[date, datetime], end: Union[date, datetime], bucket: str) -> Tuple[date, date]:
+    """Half-open [lo, hi) date range covering every whole bucket from start through end"""
+    return bucket_start(start, bucket), next_bucket_start(end, bucket)
+
+
+def in_range(column, lo: date, hi: date):
+    """Sargable lo <= column < hi predicate; datetime columns compare against midnight"""
+    if not isinstance(column.type, Date):
+        lo, hi = datetime.combine(lo, time.min), datetime.combine(hi, time.min)
+    return and_(column >= lo, column < hi)
+
+
+class time_bucket(FunctionElement):
+    """Start date of the bucket a date or datetime column falls in.
+
+    Compiles to date_trunc() on PostgreSQL and to date()/strftime() on
+    SQLite, and always comes back as a Date. Use it for grouping only and
+    filter with in_range(), which leaves the column bare so an index on it
+    can serve the range.
+    """
+    type = Date()
+    name = "time_bucket"
+    inherit_cache = True
+
+    def __init__(self, bucket: str, column):
+        _check_bucket(bucket)
+        # The bucket name is a literal, not a bind, so it is part of the cache key
+        super().__init__(literal_column(f"'{bucket}'"), column)
+
+    @property
+    def bucket(self) -> str:
+        return self.clauses.clauses[0].name.strip("'")
+
+    @property
+    def column(self):
+        return self.clauses.clauses[1]
+
+
+@compiles(time_bucket)
+def _compile_time_bucket(element, compiler, **kw):
+    return "CAST(date_trunc('%s', %s) AS DATE)" % (element.bucket, compiler.process(element.column, **kw))
+
+
+@compiles(time_bucket, "sqlite")
+def _compile_time_bucket_sqlite(element, compiler, **kw):
+    return _SQLITE_BUCKETS[element.bucket].format(column=compiler.process(element.column, **kw))
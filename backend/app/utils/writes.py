@@ -0,0 +1,66 @@
+from sqlalchemy import inspect, insert, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.session import make_transient_to_detached
+
+
+def supports_returning(db: Session, kind: str = "insert") -> bool:
+    """Whether the bound database accepts INSERT/UPDATE ... RETURNING"""
+    dialect = db.get_bind().dialect
+    return getattr(dialect, f"{kind}_returning", dialect.name == "postgresql")
+
+
+def _load_row(instance, mapper, row):
+    for prop in mapper.column_attrs:
+        set_committed_value(instance, prop.key, row._mapping[prop.columns[0]])
+
+
+def insert_returning(db: Session, instance):
+    """Insert a new instance and load every generated column in the same statement.
+
+    Where the database supports RETURNING the row comes back with its id and
+    defaults, and the instance joins the session as persistent and fully
+    loaded, so no refresh SELECT is needed after commit. Otherwise the
+    instance is flushed normally. The caller commits.
+    """
+    mapper = inspect(instance).mapper
+    if not supports_returning(db, "insert"):
+        db.add(instance)
+        db.flush()
+        return instance
+
+    table = mapper.local_table
+    values = {
+        prop.columns[0].key: instance.__dict__[prop.key]
+        for prop in mapper.column_attrs if prop.key in instance.__dict__
+    }
+    row = db.execute(insert(table).values(values).returning(*table.c)).one()
+    _load_row(instance, mapper, row)
+    make_transient_to_detached(instance)
+    db.add(instance)
+    return instance
+
+
+def update_returning(db: Session, instance):
+    """Write a persistent instance's pending changes and reload it in the same statement.
+
+    Columns computed by the database on update (such as ``onupdate=func.now()``)
+    come back through RETURNING instead of being expired and re-selected
+    later. Without RETURNING support this is a plain flush. The caller commits.
+    """
+    state = inspect(instance)
+    mapper = state.mapper
+    changes = {
+        prop.columns[0].key: getattr(instance, prop.key)
+        for prop in mapper.column_attrs if state.attrs[prop.key].history.has_changes()
+    }
+    if not changes or not supports_returning(db, "update"):
+        db.flush()
+        return instance
+
+    table = mapper.local_table
+    statement = update(table).values(changes).returning(*table.c)
+    for column, value in zip(mapper.primary_key, state.identity):
+        statement = statement.where(column == value)
+    _load_row(instance, mapper, db.execute(statement).one())
+    return instance
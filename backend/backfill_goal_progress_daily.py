@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Rebuild the goal_progress_daily rollup from goal_progress_history.
+
+By default only the last PROGRESS_HISTORY_FULL_DAYS days are rebuilt.
+compact_progress_history.py deletes older history rows while the rollup
+keeps counting every update, so rebuilding those days would rewrite past
+trends from the compacted history. That default is safe to run any time
+the rollup is suspected to have drifted.
+
+Pass --full once after migrating to the rollup table, before progress
+history has ever been compacted, to rebuild every day. Either way the
+rebuild runs in a single transaction, so it is safe to re-run.
+
+Usage: python backfill_goal_progress_daily.py [--full]
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal
+from app.services.progress_rollup import rebuild_rollup, compaction_safe_since
+
+
+def main():
+    since = None if "--full" in sys.argv else compaction_safe_since()
+    if since is None:
+        print("📊 Rebuilding all of goal_progress_daily from progress history...")
+    else:
+        print(f"📊 Rebuilding goal_progress_daily from {since} on (use --full before any compaction)...")
+    db = SessionLocal()
+    try:
+        rows = rebuild_rollup(db, since)
+        print(f"✅ Wrote {rows} daily rollup rows")
+    except Exception as e:
+        print(f"❌ Backfill failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-statement admin overview against the six separate
+aggregate queries it replaced, on a seeded database.
+
+Usage: python benchmarks/admin_overview.py [user_count] [database_url]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, func, insert, select
+from app.database import Base
+from app.models.user import User, UserRole, ApprovalStatus
+from app.models.goal import Goal, GoalStatus
+from app.models.review import Review, ReviewType
+from app.models.skill import Skill, SkillCategory, CompetencyLevel
+from app.services.report_service import admin_overview_statement, admin_overview_from_rows
+
+GOALS_PER_USER = 8
+SKILLS_PER_USER = 5
+REPEATS = 20
+
+
+def seed(engine, user_count):
+    rng = random.Random(7)
+    now = datetime.now()
+    with engine.begin() as connection:
+        connection.execute(insert(User.__table__), [
+            {
+                "id": user_id, "name": f"User {user_id}", "email": f"user{user_id}@example.com",
+                "password_hash": "x", "role": rng.choice(list(UserRole)),
+                "approval_status": ApprovalStatus.APPROVED, "department": rng.choice(["Eng", "Sales", "Ops"]),
+                "created_at": now - timedelta(days=rng.randint(0, 365))
+            }
+            for user_id in range(1, user_count + 1)
+        ])
+        goals = [
+            {
+                "id": goal_id, "user_id": (goal_id - 1) // GOALS_PER_USER + 1, "title": f"Goal {goal_id}",
+                "status": rng.choice(list(GoalStatus)), "progress": rng.randint(0, 100)
+            }
+            for goal_id in range(1, user_count * GOALS_PER_USER + 1)
+        ]
+        connection.execute(insert(Goal.__table__), goals)
+        connection.execute(insert(Review.__table__), [
+            {
+                "goal_id": goal["id"], "reviewer_id": goal["user_id"], "review_type": review_type,
+                "quarter": "Q1 2025", "rating": rng.randint(1, 5)
+            }
+            for goal in goals for review_type in ReviewType
+        ])
+        connection.execute(insert(Skill.__table__), [
+            {
+                "user_id": user_id, "name": f"Skill {n}", "category": rng.choice(list(SkillCategory)),
+                "competency_level": rng.choice(list(CompetencyLevel)), "is_development_area": "false"
+            }
+            for user_id in range(1, user_count + 1) for n in range(SKILLS_PER_USER)
+        ])
+
+
+def six_query_overview(connection, since):
+    """The previous implementation: one round trip per panel"""
+    users_by_role = connection.execute(
+        select(User.role, func.count(User.id).label('count')).group_by(User.role)
+    ).all()
+    goals_by_status = connection.execute(
+        select(Goal.status, func.count(Goal.id).label('count')).group_by(Goal.status)
+    ).all()
+    avg_progress = connection.execute(select(func.avg(Goal.progress))).scalar() or 0
+    recent_registrations = connection.execute(
+        select(func.count(User.id)).where(User.created_at >= since)
+    ).scalar()
+    skills_by_category = connection.execute(
+        select(Skill.category, func.count(Skill.id).label('count')).group_by(Skill.category)
+    ).all()
+    reviews_by_rating = connection.execute(
+        select(Review.rating, func.count(Review.id).label('count'))
+        .group_by(Review.rating).order_by(Review.rating)
+    ).all()
+    return {
+        "users_by_role": [{"role": role, "count": count} for role, count in users_by_role],
+        "goals_by_status": [{"status": status, "count": count} for status, count in goals_by_status],
+        "average_goal_progress": float(avg_progress),
+        "recent_registrations": recent_registrations,
+        "skills_by_category": [{"category": category, "count": count} for category, count in skills_by_category],
+        "reviews_by_rating": [{"rating": rating, "count": count} for rating, count in reviews_by_rating]
+    }
+
+
+def single_statement_overview(connection, since):
+    return admin_overview_from_rows(connection.execute(admin_overview_statement(since)).all())
+
+
+def normalized(overview):
+    """Panel order is not part of the contract; compare panels as sorted lists"""
+    result = {}
+    for panel, value in overview.items():
+        if isinstance(value, list):
+            result[panel] = sorted((str(next(iter(item.values()))), item["count"]) for item in value)
+        else:
+            result[panel] = round(value, 6)
+    return result
+
+
+def timed(connection, overview, since):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = overview(connection, since)
+    return (time.perf_counter() - start) / REPEATS * 1000, result
+
+
+def main():
+    user_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    if len(sys.argv) > 2:
+        engine = create_engine(sys.argv[2])
+    else:
+        path = os.path.join(tempfile.mkdtemp(), "overview.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        seed(engine, user_count)
+        print(f"Seeded {user_count:,} users, {user_count * GOALS_PER_USER:,} goals, "
+              f"{user_count * GOALS_PER_USER * 2:,} reviews, {user_count * SKILLS_PER_USER:,} skills")
+
+    since = datetime.now() - timedelta(days=30)
+    with engine.connect() as connection:
+        before_ms, before = timed(connection, six_query_overview, since)
+        after_ms, after = timed(connection, single_statement_overview, since)
+
+    assert normalized(before) == normalized(after), "overview results differ"
+    print(f"six queries:       {before_ms:8.2f} ms")
+    print(f"single statement:  {after_ms:8.2f} ms")
+    print(f"Speedup: {before_ms / after_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
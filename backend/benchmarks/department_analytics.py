@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized department analytics against the same statistics
+computed with per-department Python lists, on a seeded organization.
+
+Usage: python benchmarks/department_analytics.py [employee_count] [database_url]
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+from app.database import Base
+from app.models.user import User, UserRole, ApprovalStatus
+from app.models.goal import Goal, GoalStatus
+from app.models.review import Review, ReviewType
+from app.models.skill import Skill, SkillCategory, CompetencyLevel
+from app.services.analytics import (
+    department_stats_statements, department_stats, COMPETENCY_LEVELS, DEFAULT_PERCENTILES
+)
+
+DEPARTMENTS = [f"Department {n:02d}" for n in range(20)]
+GOALS_PER_EMPLOYEE = 3
+SKILLS_PER_EMPLOYEE = 3
+
+
+def seed(engine, employee_count):
+    rng = random.Random(11)
+    with engine.begin() as connection:
+        connection.execute(insert(User.__table__), [
+            {
+                "id": user_id, "name": f"Employee {user_id}", "email": f"employee{user_id}@example.com",
+                "password_hash": "x", "role": UserRole.EMPLOYEE, "approval_status": ApprovalStatus.APPROVED,
+                "department": rng.choice(DEPARTMENTS)
+            }
+            for user_id in range(1, employee_count + 1)
+        ])
+        goal_count = employee_count * GOALS_PER_EMPLOYEE
+        connection.execute(insert(Goal.__table__), [
+            {
+                "id": goal_id, "user_id": (goal_id - 1) // GOALS_PER_EMPLOYEE + 1, "title": "Goal",
+                "status": GoalStatus.approved, "progress": rng.randint(0, 100)
+            }
+            for goal_id in range(1, goal_count + 1)
+        ])
+        connection.execute(insert(Review.__table__), [
+            {
+                "goal_id": goal_id, "reviewer_id": 1, "review_type": ReviewType.manager_review,
+                "quarter": "Q1 2025", "rating": rng.randint(1, 5)
+            }
+            for goal_id in range(1, goal_count + 1)
+        ])
+        connection.execute(insert(Skill.__table__), [
+            {
+                "user_id": user_id, "name": f"Skill {n}", "category": rng.choice(list(SkillCategory)),
+                "competency_level": rng.choice(list(CompetencyLevel)), "is_development_area": "false"
+            }
+            for user_id in range(1, employee_count + 1) for n in range(SKILLS_PER_EMPLOYEE)
+        ])
+
+
+def percentile(ordered, p):
+    position = (len(ordered) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def python_distribution(groups):
+    result = {}
+    for department, values in groups.items():
+        ordered = sorted(values)
+        result[department] = {
+            "mean": statistics.fmean(ordered),
+            "std": statistics.pstdev(ordered),
+            **{f"p{p}": percentile(ordered, p) for p in DEFAULT_PERCENTILES},
+        }
+    return result
+
+
+def python_department_stats(user_rows, goal_rows, rating_rows, skill_rows):
+    """The same statistics with per-department Python lists"""
+    department_of = dict(user_rows)
+    progress, ratings = defaultdict(list), defaultdict(list)
+    histogram = defaultdict(lambda: [0] * len(COMPETENCY_LEVELS))
+    for user_id, value in goal_rows:
+        if user_id in department_of:
+            progress[department_of[user_id]].append(float(value))
+    for user_id, value in rating_rows:
+        if user_id in department_of:
+            ratings[department_of[user_id]].append(float(value))
+    for user_id, level in skill_rows:
+        if user_id in department_of:
+            histogram[department_of[user_id]][level] += 1
+    return python_distribution(progress), python_distribution(ratings), dict(histogram)
+
+
+def timed(function, *args, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    employee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    if len(sys.argv) > 2:
+        engine = create_engine(sys.argv[2])
+    else:
+        path = os.path.join(tempfile.mkdtemp(), "analytics.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        print(f"Seeding {employee_count:,} employees...")
+        seed(engine, employee_count)
+
+    with engine.connect() as connection:
+        start = time.perf_counter()
+        rows = {name: connection.execute(statement).all() for name, statement in department_stats_statements().items()}
+        load_ms = (time.perf_counter() - start) * 1000
+    args = (rows["users"], rows["goals"], rows["ratings"], rows["skills"])
+    print(f"Loaded {sum(len(r) for r in rows.values()):,} rows in {load_ms:.0f} ms")
+
+    python_ms, (progress, _, _) = timed(python_department_stats, *args)
+    numpy_ms, stats = timed(department_stats, *args)
+
+    for entry in stats["progress_by_department"]:
+        expected = progress[entry["department"]]
+        assert abs(entry["mean"] - round(expected["mean"], 2)) < 0.011
+        assert abs(entry["p90"] - round(expected["p90"], 2)) < 0.011
+
+    print(f"Python lists:  {python_ms:8.1f} ms")
+    print(f"Vectorized:    {numpy_ms:8.1f} ms")
+    print(f"Speedup: {python_ms / numpy_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark indexed MemoryRepository lookups against the linear scans the
+Flask entry point used to do over plain lists.
+
+Usage: python benchmarks/memory_repository.py [goal_count]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.memory_repository import MemoryRepository
+
+STATUSES = ["draft", "submitted", "approved", "rejected", "pending_review"]
+
+
+def build_goals(count):
+    rng = random.Random(42)
+    return [
+        {
+            "id": goal_id,
+            "title": f"Goal {goal_id}",
+            "status": rng.choice(STATUSES),
+            "progress": rng.randint(0, 100),
+            "user_id": rng.randint(1, count // 10 or 1)
+        }
+        for goal_id in range(1, count + 1)
+    ]
+
+
+def report(label, scan_seconds, indexed_seconds, runs):
+    scan_us = scan_seconds / runs * 1e6
+    indexed_us = indexed_seconds / runs * 1e6
+    print(f"{label:<28} scan {scan_us:>12.1f} us   indexed {indexed_us:>10.2f} us   "
+          f"x{scan_us / indexed_us:,.0f}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    goals = build_goals(count)
+    repo = MemoryRepository((dict(g) for g in goals), indexes=("user_id", "status"))
+    rng = random.Random(7)
+    ids = [rng.randint(1, count) for _ in range(200)]
+    user_ids = [rng.randint(1, count // 10 or 1) for _ in range(200)]
+    runs = 200
+
+    print(f"{count:,} goals, {runs} lookups per case\n")
+
+    scan = timeit.timeit(lambda: [next((g for g in goals if g["id"] == i), None) for i in ids], number=1)
+    indexed = timeit.timeit(lambda: [repo.get(i) for i in ids], number=1)
+    report("get goal by id", scan, indexed, runs)
+
+    scan = timeit.timeit(lambda: [[g for g in goals if g["user_id"] == u] for u in user_ids[:20]], number=1)
+    indexed = timeit.timeit(lambda: [repo.find(user_id=u) for u in user_ids[:20]], number=1)
+    report("goals for user", scan, indexed, 20)
+
+    scan = timeit.timeit(lambda: [g for g in goals if g["status"] == "pending_review"], number=5)
+    indexed = timeit.timeit(lambda: repo.find(status="pending_review"), number=5)
+    report("goals awaiting review", scan, indexed, 5)
+
+    scan = timeit.timeit(
+        lambda: [[g for g in goals if g["user_id"] == u and g["status"] == "draft"] for u in user_ids[:20]],
+        number=1
+    )
+    indexed = timeit.timeit(lambda: [repo.find(user_id=u, status="draft") for u in user_ids[:20]], number=1)
+    report("draft goals for user", scan, indexed, 20)
+
+
+if __name__ == "__main__":
+    main()
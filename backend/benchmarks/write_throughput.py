@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark single-row writes: the old add/commit/refresh pattern on an
+expire-on-commit session against insert_returning on a session that keeps
+objects loaded after commit. Each write also reads every column back, as
+serializing the response does.
+
+Usage: python benchmarks/write_throughput.py [writes] [database_url]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.models.user import User, UserRole, ApprovalStatus
+from app.models.skill import Skill, SkillCategory, CompetencyLevel
+from app.models.notification import Notification, NotificationType
+from app.utils.query_stats import install_query_stats, start_request, finish_request
+from app.utils.writes import insert_returning
+
+
+def make_skill(user_id, n):
+    return Skill(
+        user_id=user_id,
+        name=f"Skill {n}",
+        category=SkillCategory.TECHNICAL,
+        competency_level=CompetencyLevel.INTERMEDIATE,
+        is_development_area="false"
+    )
+
+
+def make_notification(user_id, n):
+    return Notification(
+        user_id=user_id,
+        title=f"Notification {n}",
+        message="Benchmark",
+        notification_type=NotificationType.SYSTEM_MESSAGE
+    )
+
+
+def serialize(instance):
+    return {prop.key: getattr(instance, prop.key) for prop in inspect(instance).mapper.column_attrs}
+
+
+def write_with_refresh(db, instance):
+    db.add(instance)
+    db.commit()
+    db.refresh(instance)
+    return serialize(instance)
+
+
+def write_with_returning(db, instance):
+    insert_returning(db, instance)
+    db.commit()
+    return serialize(instance)
+
+
+def run(engine, label, expire_on_commit, write, writes, user_id):
+    Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=expire_on_commit)
+    db = Session()
+    token = start_request(label)
+    start = time.perf_counter()
+    for n in range(writes):
+        factory = make_skill if n % 2 else make_notification
+        write(db, factory(user_id, n))
+    elapsed = time.perf_counter() - start
+    stats = finish_request(token)
+    db.close()
+    print(f"{label:<22} {writes / elapsed:>10,.0f} writes/s  {stats.query_count / writes:.1f} statements/write")
+    return writes / elapsed
+
+
+def main():
+    writes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    if len(sys.argv) > 2:
+        engine = create_engine(sys.argv[2])
+    else:
+        path = os.path.join(tempfile.mkdtemp(), "writes.db")
+        engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    install_query_stats(engine)
+    # Every write repeats the same INSERT; that is the workload, not an N+1
+    logging.getLogger("app.utils.query_stats").setLevel(logging.ERROR)
+
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    user = User(
+        name="Benchmark", email=f"benchmark-{time.time_ns()}@example.com", password_hash="x",
+        role=UserRole.EMPLOYEE, approval_status=ApprovalStatus.APPROVED
+    )
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+
+    print(f"{writes:,} writes on {engine.dialect.name}\n")
+    before = run(engine, "add/commit/refresh", True, write_with_refresh, writes, user_id)
+    after = run(engine, "insert_returning", False, write_with_returning, writes, user_id)
+    print(f"\nSpeedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
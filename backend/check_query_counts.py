@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Verify that the goal endpoints issue a fixed number of queries.
+
+Each scenario calls a real endpoint function from app.api.goal against a
+small and a large seeded dataset with query counting enabled, then
+serializes the result through GoalResponse the way FastAPI does. The check
+fails if the query count grows with the number of goals (an N+1 on
+Goal.user) or exceeds the expected count.
+
+Usage: python check_query_counts.py
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import logging
+from fastapi import Response
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+import app.utils.security as security
+
+# app.api's package __init__ imports every router, and auth/skills import a
+# verify_token that app.utils.security does not define; stand one in so the
+# goal router can be imported. The endpoints checked here never call it.
+if not hasattr(security, "verify_token"):
+    security.verify_token = lambda token: None
+
+from app.database import Base
+from app.models.user import User, UserRole, ApprovalStatus
+from app.models.goal import Goal, GoalStatus
+from app.schemas.goal import GoalResponse
+from app.api.goal import list_goals_for_review, list_all_goals, get_goal
+from app.utils.query_stats import install_query_stats, start_request, finish_request
+
+SIZES = (5, 100)
+
+# (description, function(db, users) calling the endpoint and returning its goals, queries expected)
+SCENARIOS = [
+    (
+        "list_goals_for_review: reviewer's queue",
+        lambda db, users: list_goals_for_review(db=db, current_user=users["reviewer"]),
+        1,
+    ),
+    (
+        "list_all_goals: admin, every goal",
+        lambda db, users: list_all_goals(
+            response=Response(), cursor=None, limit=None, db=db, current_user=users["admin"]
+        ),
+        1,
+    ),
+    (
+        "list_all_goals: reviewer's org subtree, first page",
+        lambda db, users: list_all_goals(
+            response=Response(), cursor=None, limit=50, db=db, current_user=users["reviewer"]
+        ),
+        1,
+    ),
+    (
+        "get_goal: employee's own goal",
+        lambda db, users: [get_goal(users["goal_id"], db=db, current_user=users["employee"])],
+        1,
+    ),
+]
+
+
+def serialize(goal):
+    """Validate a goal into GoalResponse, reading every field FastAPI would"""
+    if hasattr(GoalResponse, "model_validate"):
+        return GoalResponse.model_validate(goal, from_attributes=True)
+    return GoalResponse.from_orm(goal)
+
+
+def seed(db, goal_count):
+    """An admin and a reviewer whose queue holds goal_count submitted goals, each from a different employee"""
+    admin = User(
+        name="Admin", email="admin@example.com", password_hash="x",
+        role=UserRole.ADMIN, approval_status=ApprovalStatus.APPROVED
+    )
+    reviewer = User(
+        name="Reviewer", email="reviewer@example.com", password_hash="x",
+        role=UserRole.REVIEWER, approval_status=ApprovalStatus.APPROVED
+    )
+    db.add_all([admin, reviewer])
+    db.flush()
+    goal = employee = None
+    for n in range(goal_count):
+        employee = User(
+            name=f"Employee {n}", email=f"employee{n}@example.com", password_hash="x",
+            role=UserRole.EMPLOYEE, approval_status=ApprovalStatus.APPROVED, manager_id=reviewer.id
+        )
+        db.add(employee)
+        db.flush()
+        goal = Goal(
+            user_id=employee.id, title=f"Goal {n}", description="Quarterly goal",
+            status=GoalStatus.submitted, reviewer_id=reviewer.id
+        )
+        db.add(goal)
+    db.commit()
+    return {"admin": admin, "reviewer": reviewer, "employee": employee, "goal_id": goal.id}
+
+
+def count_queries(function, goal_count):
+    """Run a scenario on a fresh database with goal_count goals; returns the queries issued"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    install_query_stats(engine)
+    db = sessionmaker(bind=engine, expire_on_commit=False)()
+    users = seed(db, goal_count)
+    db.expunge_all()
+
+    token = start_request()
+    try:
+        responses = [serialize(goal) for goal in function(db, users)]
+    finally:
+        stats = finish_request(token)
+        db.close()
+    assert responses and all(response.user is not None for response in responses)
+    return stats.query_count
+
+
+def main():
+    # Repeated statements are exactly what this check reports on; skip the N+1 warnings
+    logging.getLogger("app.utils.query_stats").setLevel(logging.ERROR)
+    failures = 0
+    for description, function, expected in SCENARIOS:
+        counts = [count_queries(function, size) for size in SIZES]
+        summary = ", ".join(f"{size} goals: {count}" for size, count in zip(SIZES, counts))
+        if len(set(counts)) == 1 and counts[0] <= expected:
+            print(f"✅ {description}: {summary}")
+        else:
+            failures += 1
+            print(f"❌ {description}: expected {expected} queries at every size ({summary})")
+
+    if failures:
+        print(f"\n{failures} of {len(SCENARIOS)} scenarios issue queries per goal")
+        sys.exit(1)
+    print(f"\nAll {len(SCENARIOS)} scenarios use a fixed number of queries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Verify that the hot router queries are served by their composite indexes.
+
+Each query is run through EXPLAIN (EXPLAIN QUERY PLAN on SQLite) and the
+plan must name the expected index. By default the check builds a scratch
+in-memory SQLite database from the models; pass a database URL to check a
+migrated database instead.
+
+Usage: python check_query_plans.py [database_url]
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, select, func, text
+from datetime import date
+from app.database import Base
+from app.models.user import User, UserRole
+from app.models.goal import Goal, GoalStatus, GoalProgressHistory, GoalProgressDaily
+from app.models.review import Review, ReviewType
+from app.models.skill import Skill
+from app.models.notification import Notification
+from app.services.org_tree import subordinate_ids
+from app.services.report_service import progress_trend_statement
+from app.services.review_service import review_comparison_statement, visible_review_comparisons
+from app.utils.time_buckets import bucket_range, in_range, time_bucket
+
+# (description, statement, index the plan must use)
+HOT_QUERIES = [
+    (
+        "list_goals: goals owned by a user",
+        select(Goal).where(Goal.user_id == 1),
+        "ix_goals_user_id_status",
+    ),
+    (
+        "submit_all_draft_goals: a user's drafts",
+        select(Goal).where(Goal.user_id == 1, Goal.status == GoalStatus.draft),
+        "ix_goals_user_id_status",
+    ),
+    (
+        "list_goals_for_review: reviewer's submitted queue",
+        select(Goal).where(Goal.reviewer_id == 1, Goal.status == GoalStatus.submitted),
+        "ix_goals_reviewer_id_status",
+    ),
+    (
+        "list_all_goals: a manager's employees",
+        select(User.id).where(User.manager_id == 1, User.role == UserRole.EMPLOYEE),
+        "ix_users_manager_id_role",
+    ),
+    (
+        "reports: a manager's direct reports",
+        select(User).where(User.manager_id == 1),
+        "ix_users_manager_id_role",
+    ),
+    (
+        "get_user_notifications: newest first",
+        select(Notification).where(Notification.user_id == 1)
+        .order_by(Notification.created_at.desc()).limit(50),
+        "ix_notifications_user_id_is_read_created_at",
+    ),
+    (
+        "get_unread_count",
+        select(func.count(Notification.id)).where(
+            Notification.user_id == 1, Notification.is_read == False
+        ),
+        "ix_notifications_user_id_is_read_created_at",
+    ),
+    (
+        "get_skills: a user's skills",
+        select(Skill).where(Skill.user_id == 1),
+        "ix_skills_user_id_category",
+    ),
+    (
+        "create_review: duplicate check",
+        select(Review).where(
+            Review.goal_id == 1,
+            Review.quarter == "Q1 2025",
+            Review.review_type == ReviewType.manager_review
+        ),
+        "ix_reviews_goal_id_quarter_review_type",
+    ),
+    (
+        "team reports: a manager's reviews",
+        select(Review.rating, func.count(Review.id)).where(
+            Review.reviewer_id == 1,
+            Review.review_type == ReviewType.manager_review
+        ).group_by(Review.rating),
+        "ix_reviews_reviewer_id_review_type",
+    ),
+    (
+        "get_review_summary: most recent reviews",
+        select(Review).order_by(Review.created_at.desc(), Review.id.desc()).limit(5),
+        "ix_reviews_created_at",
+    ),
+    (
+        "get_review_comparisons: a batch of goals in a quarter",
+        review_comparison_statement("Q1 2025", goal_ids=[1, 2, 3]),
+        "ix_reviews_goal_id_quarter_review_type",
+    ),
+    (
+        "get_review_comparisons: a reviewer's whole team",
+        visible_review_comparisons("Q1 2025", User(id=1, role=UserRole.REVIEWER), team=True),
+        "ix_users_manager_id_role",
+    ),
+    (
+        "get_goal_progress_history: a goal's history",
+        select(GoalProgressHistory).where(GoalProgressHistory.goal_id == 1)
+        .order_by(GoalProgressHistory.created_at.desc()),
+        "ix_goal_progress_history_goal_id_created_at",
+    ),
+    (
+        "trends: weekly buckets over the rollup",
+        progress_trend_statement(date(2025, 1, 1), date(2025, 3, 31), "week"),
+        "ix_goal_progress_daily_day",
+    ),
+    (
+        "trends: a user's daily rollup",
+        select(GoalProgressDaily).where(
+            GoalProgressDaily.user_id == 1,
+            in_range(GoalProgressDaily.day, *bucket_range(date(2025, 1, 1), date(2025, 3, 31), "month"))
+        ),
+        "ix_goal_progress_daily_user_id_day",
+    ),
+    (
+        "time series: a user's progress history in a quarter",
+        select(time_bucket("week", GoalProgressHistory.created_at), func.avg(GoalProgressHistory.progress))
+        .where(
+            GoalProgressHistory.user_id == 1,
+            in_range(GoalProgressHistory.created_at, *bucket_range(date(2025, 1, 1), date(2025, 1, 1), "quarter"))
+        )
+        .group_by(time_bucket("week", GoalProgressHistory.created_at)),
+        "ix_goal_progress_history_user_id_created_at",
+    ),
+    (
+        "org tree: every level of a manager's subtree",
+        subordinate_ids(1),
+        "ix_users_manager_id_role",
+    ),
+]
+
+
+def explain(connection, statement):
+    """Return the plan for a statement as a single string"""
+    sql = str(statement.compile(connection, compile_kwargs={"literal_binds": True}))
+    if connection.dialect.name == "sqlite":
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return "\n".join(str(row[-1]) for row in rows)
+    rows = connection.execute(text(f"EXPLAIN {sql}")).all()
+    return "\n".join(str(row[0]) for row in rows)
+
+
+def check_plans(engine):
+    """Print each hot query's plan status and return the number of failures"""
+    failures = 0
+    with engine.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            # Small tables make a sequential scan cheapest; ask whether an index path exists
+            connection.execute(text("SET enable_seqscan = off"))
+        for description, statement, index_name in HOT_QUERIES:
+            plan = explain(connection, statement)
+            if index_name in plan:
+                print(f"✅ {description}: {index_name}")
+            else:
+                failures += 1
+                print(f"❌ {description}: expected {index_name}")
+                print("   " + plan.replace("\n", "\n   "))
+    return failures
+
+
+def main():
+    if len(sys.argv) > 1:
+        engine = create_engine(sys.argv[1])
+    else:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+
+    failures = check_plans(engine)
+    if failures:
+        print(f"\n{failures} of {len(HOT_QUERIES)} hot queries are not using their index")
+        sys.exit(1)
+    print(f"\nAll {len(HOT_QUERIES)} hot queries use their index")
+
+
+if __name__ == "__main__":
+    main()
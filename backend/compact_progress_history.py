@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Downsample old goal progress history.
+
+Rows from the last PROGRESS_HISTORY_FULL_DAYS days are kept as they are;
+older rows are reduced to one point per day, and rows older than
+PROGRESS_HISTORY_DAILY_DAYS to one point per week. The first point of
+every goal and every point with comments are always kept. Each batch of
+goals commits on its own, so the job can be stopped and re-run safely.
+
+The goal_progress_daily rollup keeps its totals, so trends are unchanged.
+After compaction, run backfill_goal_progress_daily.py without --full:
+it only rebuilds the days compaction never touches.
+
+Usage: python compact_progress_history.py
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.config.settings import settings
+from app.database import SessionLocal
+from app.services.progress_compaction import compact_progress_history
+
+
+def main():
+    print(
+        f"🗜️ Compacting progress history older than {settings.PROGRESS_HISTORY_FULL_DAYS} days "
+        f"(weekly after {settings.PROGRESS_HISTORY_DAILY_DAYS} days)..."
+    )
+    db = SessionLocal()
+    try:
+        deleted = compact_progress_history(db)
+        print(f"✅ Removed {deleted} progress history rows")
+    except Exception as e:
+        print(f"❌ Compaction failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
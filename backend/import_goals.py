@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Bulk import goals from a CSV or JSONL file.
+
+Each row holds employee_email plus the GoalCreate fields (title,
+description, target, quarter, start_date, end_date, comments,
+reviewer_id); goals are created as drafts. Rows are validated and
+committed in batches of IMPORT_BATCH_SIZE, and bad rows are reported
+without stopping the import.
+
+Progress is checkpointed to <file>.checkpoint after every batch, so
+re-running the same command resumes where an interrupted import stopped.
+Goals that already exist (same employee, title and quarter) are skipped.
+
+Usage: python import_goals.py <file.csv|file.jsonl> [--restart]
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal
+from app.services.goal_import import import_goals, IMPORT_FORMATS
+
+# Errors printed at the end of a run; the rest are only counted
+ERRORS_SHOWN = 20
+
+
+def import_format_for(path):
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    return "jsonl" if extension in ("jsonl", "ndjson") else extension
+
+
+def read_checkpoint(path):
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        return int(f.read().strip() or 0)
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if len(args) != 1:
+        print(__doc__)
+        sys.exit(1)
+    path = args[0]
+    import_format = import_format_for(path)
+    if import_format not in IMPORT_FORMATS:
+        print(f"❌ Unsupported file type; use one of: {', '.join(IMPORT_FORMATS)}")
+        sys.exit(1)
+
+    checkpoint_path = path + ".checkpoint"
+    if "--restart" in sys.argv and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    start_row = read_checkpoint(checkpoint_path)
+    if start_row:
+        print(f"↪️ Resuming after row {start_row}")
+
+    def save_checkpoint(summary):
+        with open(checkpoint_path, "w") as f:
+            f.write(str(summary["last_row"]))
+        print(
+            f"   row {summary['last_row']}: {summary['imported']} imported, "
+            f"{summary['skipped']} skipped, {summary['failed']} failed"
+        )
+
+    print(f"📥 Importing goals from {path}...")
+    db = SessionLocal()
+    try:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            summary = import_goals(db, f, import_format, start_row=start_row, on_batch=save_checkpoint)
+    except Exception as e:
+        print(f"❌ Import stopped: {e}")
+        print("   Re-run the same command to resume from the last checkpoint")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    if summary.get("error"):
+        print(f"❌ Import stopped after row {summary['last_row']}: {summary['error']}")
+        print("   Fix the problem and re-run the same command to resume from the last checkpoint")
+        sys.exit(1)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    print(f"✅ Imported {summary['imported']} goals ({summary['skipped']} already present)")
+    if summary["failed"]:
+        print(f"⚠️ {summary['failed']} rows failed:")
+        for error in summary["errors"][:ERRORS_SHOWN]:
+            print(f"   row {error['row']}: {error['error']}")
+        if summary["failed"] > ERRORS_SHOWN:
+            print(f"   ...and {summary['failed'] - ERRORS_SHOWN} more")
+
+
+if __name__ == "__main__":
+    main()
@@ -62,7 +62,7 @@ api.interceptors.response.use(
     console.log('Response received:', response.status, response.data)
     return response
   },
-  (error) => {
+  async (error) => {
     console.error('API Error:', error.response?.data || error.message)
     console.error('Error details:', {
       status: error.response?.status,
@@ -71,6 +71,20 @@ api.interceptors.response.use(
       baseURL: error.config?.baseURL
     })
     if (error.response?.status === 401) {
+      const { refreshToken, updateToken, updateRefreshToken } = useAuthStore.getState()
+      const request = error.config
+      // Access tokens expire; renew once with the refresh token and retry the request
+      if (refreshToken && request && !request._retried && !request.url?.includes('/auth/refresh')) {
+        request._retried = true
+        try {
+          const { data } = await api.post('/auth/refresh', { refresh_token: refreshToken })
+          updateToken(data.access_token)
+          updateRefreshToken(data.refresh_token)
+          return api(request)
+        } catch (refreshError) {
+          console.error('Token refresh failed:', refreshError.response?.data || refreshError.message)
+        }
+      }
       // Handle unauthorized access
       useAuthStore.getState().logout()
       window.location.href = '/login'